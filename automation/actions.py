@@ -12,8 +12,9 @@ Supported actions (type field in JSON):
 
 Notes
 -----
-- On Windows, we use pywinauto for reliable background key dispatch and
-  window activation. On other platforms, we fallback to pynput to send
+- On Windows, keystrokes are submitted as one batched SendInput call per
+  action; pywinauto is used for window activation and as a fallback when
+  SendInput is blocked (e.g. by UIPI). On other platforms, we fallback to pynput to send
   keystrokes to the currently focused window (true background control is
   limited by the OS without accessibility permissions).
 """
@@ -21,17 +22,23 @@ Notes
 from __future__ import annotations
 
 from dataclasses import dataclass
+import ctypes
+import functools
+import re
 import subprocess
 import sys
+import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple, Callable
 
+from . import win32
+
 
 class ActionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseAction:
     """Common interface for all actions."""
 
@@ -41,37 +48,27 @@ class BaseAction:
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "BaseAction":
         action_type = str(data.get("type", "")).strip().lower()
-        if action_type == "launch_process":
-            return LaunchProcessAction(
-                command=str(data.get("command")),
-                args=list(data.get("args", [])),
-                cwd=data.get("cwd"),
-                wait=float(data.get("wait", 0.0) or 0.0),
-            )
-        if action_type == "wait":
-            return WaitAction(milliseconds=int(data.get("milliseconds", 0) or 0))
-        if action_type == "send_keys":
-            return SendKeysAction(sequence=str(data.get("sequence", "")))
-        if action_type == "type_text":
-            return TypeTextAction(text=str(data.get("text", "")))
-        if action_type == "window_activate":
-            return WindowActivateAction(title=str(data.get("title", "")))
-        if action_type == "mouse_click":
-            return MouseClickAction(
-                x=data.get("x"),
-                y=data.get("y"),
-                button=str(data.get("button", "left") or "left"),
-                clicks=int(data.get("clicks", 1) or 1),
-            )
-        if action_type == "scroll":
-            return ScrollAction(
-                amount=int(data.get("amount", 0) or 0),
-                horizontal=bool(data.get("horizontal", False)),
-            )
-        raise ActionError(f"Unknown action type: {action_type}")
-
-
-@dataclass
+        parser = _ACTION_REGISTRY.get(action_type)
+        if parser is None:
+            raise ActionError(f"Unknown action type: {action_type}")
+        return parser(data)
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+# Windows: don't allocate a console for the child. POSIX: with no preexec_fn
+# and close_fds left on, CPython launches via vfork/posix_spawn instead of
+# fork, so the GUI's address space is never copied.
+_POPEN_KWARGS: Dict[str, Any] = (
+    {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0), "close_fds": True}
+    if sys.platform.startswith("win")
+    else {"close_fds": True}
+)
+
+
+@dataclass(slots=True)
 class LaunchProcessAction(BaseAction):
     command: str
     args: List[str]
@@ -82,14 +79,14 @@ class LaunchProcessAction(BaseAction):
         if not self.command:
             raise ActionError("launch_process: 'command' is required")
         try:
-            subprocess.Popen([self.command, *self.args], cwd=self.cwd)
+            subprocess.Popen([self.command, *self.args], cwd=self.cwd, **_POPEN_KWARGS)
         except Exception as e:  # pragma: no cover
             raise ActionError(f"Failed to start process '{self.command}': {e}")
         if self.wait > 0:
             ctx.sleep(self.wait)
 
 
-@dataclass
+@dataclass(slots=True)
 class WaitAction(BaseAction):
     milliseconds: int
 
@@ -97,41 +94,30 @@ class WaitAction(BaseAction):
         ctx.sleep_ms(self.milliseconds)
 
 
-@dataclass
+@dataclass(slots=True)
 class SendKeysAction(BaseAction):
     sequence: str
+    post_delay: Optional[float] = None  # settle time after sending; None = backend default
 
     def run(self, ctx: "RunContext") -> None:
         if not self.sequence:
             return
-        # Try Windows backend first
+        # Try Windows backends first: one SendInput batch, then pywinauto
         if sys.platform.startswith("win"):
+            if _send_input_win32(_sequence_buffer(self.sequence)):
+                # Delivered as one batch: no stabilization needed unless requested
+                _settle(ctx, self.post_delay, 0.0)
+                return
             pw_ok = _try_pywinauto_send_keys(self.sequence, ctx, pause=0.02)
             if pw_ok:
                 # Small stabilization delay so next action doesn't start too early
-                ctx.sleep(0.05)
+                _settle(ctx, self.post_delay, 0.05)
                 return
         # Fallback to pynput
-        kb_cls, key_mod = _get_pynput()
-        if kb_cls is None or key_mod is None:
+        kb = _get_pynput_kb()
+        token_map = _get_pynput_token_map()
+        if kb is None or token_map is None:
             raise ActionError("No keyboard backend available (install pynput)")
-        kb = kb_cls()
-        token_map = {
-            "<ENTER>": getattr(key_mod, "enter", None),
-            "<TAB>": getattr(key_mod, "tab", None),
-            "<ESC>": getattr(key_mod, "esc", None),
-            "<BACKSPACE>": getattr(key_mod, "backspace", None),
-            "<DELETE>": getattr(key_mod, "delete", None),
-            "<HOME>": getattr(key_mod, "home", None),
-            "<END>": getattr(key_mod, "end", None),
-            "<PAGE_UP>": getattr(key_mod, "page_up", None),
-            "<PAGE_DOWN>": getattr(key_mod, "page_down", None),
-            "<UP>": getattr(key_mod, "up", None),
-            "<DOWN>": getattr(key_mod, "down", None),
-            "<LEFT>": getattr(key_mod, "left", None),
-            "<RIGHT>": getattr(key_mod, "right", None),
-            "<SPACE>": " ",
-        }
         for token in _tokenize_keys(self.sequence):
             mapped = token_map.get(token)
             if mapped is None:
@@ -144,66 +130,78 @@ class SendKeysAction(BaseAction):
                 else:
                     kb.press(mapped); kb.release(mapped)
         # Give the target app a moment to process
-        ctx.sleep(0.05)
-
-
-def _tokenize_keys(sequence: str) -> List[str]:
-    # Very small helper: treat bracketed tokens like <ENTER> as single units
-    out: List[str] = []
-    buf = ""
-    in_tag = False
-    for ch in sequence:
-        if ch == "<":
-            if buf:
-                out.append(buf)
-                buf = ""
-            in_tag = True
-            buf += ch
-        elif ch == ">" and in_tag:
-            buf += ch
-            out.append(buf)
-            buf = ""
-            in_tag = False
-        else:
-            buf += ch
-    if buf:
-        out.append(buf)
-    # split on spaces except tokens like <ENTER>
-    flat: List[str] = []
-    for part in out:
-        if part.startswith("<") and part.endswith(">"):
-            flat.append(part)
-        else:
-            flat.extend([p for p in part.split(" ") if p])
-    return flat
+        _settle(ctx, self.post_delay, 0.05)
+
+
+# Single-pass scanner: <NAMED> tokens, runs of literal characters, or a stray
+# '<' typed literally; spaces only separate tokens (tabs and newlines stay literal).
+_TOK_SCANNER = re.Scanner([  # type: ignore[attr-defined]
+    (r"<[A-Z_]+>", lambda _s, t: ("KEY", t)),
+    (r"[^< ]+", lambda _s, t: ("LIT", t)),
+    (r"<", lambda _s, t: ("LIT", t)),
+    (r" +", None),
+])
+
+
+@functools.lru_cache(maxsize=512)
+def _tokenize_keys(sequence: str) -> Tuple[str, ...]:
+    # Treat bracketed tokens like <ENTER> as single units
+    tokens, _rest = _TOK_SCANNER.scan(sequence)
+    return tuple(text for _kind, text in tokens)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeTextAction(BaseAction):
     text: str
+    pause: float = 0.0  # seconds between characters; 0 types without per-char delay
+    post_delay: Optional[float] = None  # settle time after typing; None = backend default
 
     def run(self, ctx: "RunContext") -> None:
         if not self.text:
             return
-        # Prefer pywinauto on Windows with a tiny pause to prevent dropped chars
+        pause = max(0.0, float(self.pause or 0.0))
+        # Prefer SendInput on Windows; pywinauto if SendInput is rejected
         if sys.platform.startswith("win"):
-            if _try_pywinauto_send_keys(self.text, ctx, pause=0.015):
-                ctx.sleep(0.1)
+            if _send_text_win32(self.text, ctx, pause):
+                _settle(ctx, self.post_delay, 0.0)
                 return
-        kb_cls, _key_mod = _get_pynput()
-        if kb_cls is None or _key_mod is None:
+            if _try_pywinauto_send_keys(self.text, ctx, pause=pause):
+                _settle(ctx, self.post_delay, 0.1)
+                return
+        kb = _get_pynput_kb()
+        if kb is None:
             raise ActionError("No keyboard backend available (install pynput)")
-        kb = kb_cls()
-        # Type per character with a very small delay to increase reliability
         for ch in self.text:
             kb.press(ch); kb.release(ch)
-            # 10ms is enough for most apps; keep it tiny to stay fast
-            ctx.sleep(0.01)
+            if pause > 0:
+                ctx.sleep(pause)
         # Stabilize before next action
-        ctx.sleep(0.1)
+        _settle(ctx, self.post_delay, 0.1)
+
+
+def _send_text_win32(text: str, ctx: "RunContext", pause: float) -> bool:
+    """Type ``text`` via SendInput: one batch, or one call per character when pausing."""
+    if pause <= 0:
+        return _send_input_win32(_typing_buffer(text))
+    sent_any = False
+    for ch in text.replace("\r\n", "\n"):
+        if not _send_input_win32(_typing_buffer(ch)):
+            if sent_any:
+                raise ActionError("type_text: SendInput rejected input mid-way")
+            return False
+        sent_any = True
+        ctx.sleep(pause)
+    return True
+
 
+def _settle(ctx: "RunContext", post_delay: Optional[float], default: float) -> None:
+    """Sleep after a keyboard action; ``post_delay`` overrides the backend default."""
+    delay = default if post_delay is None else max(0.0, float(post_delay))
+    if delay > 0:
+        ctx.sleep(delay)
 
-@dataclass
+
+@dataclass(slots=True)
 class WindowActivateAction(BaseAction):
     title: str
 
@@ -211,19 +209,61 @@ class WindowActivateAction(BaseAction):
         if not self.title:
             return
         if sys.platform.startswith("win"):
+            if _activate_win32(self.title):
+                return
             try:
-                from pywinauto import Application  # type: ignore
-                app = Application(backend="uia").connect(title_re=self.title)
-                win = app.top_window()
+                win = _cached_top_window(self.title)
                 win.set_focus()
                 return
             except Exception as e:  # pragma: no cover
+                _APP_CACHE.pop(self.title, None)
                 ctx.log(f"window_activate failed: {e}")
         # Best-effort only on non-Windows: nothing to do
         ctx.log("window_activate is only fully supported on Windows")
 
 
-@dataclass
+# title_re -> last matching top-level window handle
+_HWND_CACHE: Dict[str, int] = {}
+
+
+def _activate_win32(title: str) -> bool:
+    """Find the window by title regex (same semantics as pywinauto's title_re) and focus it."""
+    try:
+        match = re.compile(title).match
+    except re.error:
+        return False
+    hwnd = _HWND_CACHE.get(title, 0)
+    if not (win32.is_window(hwnd) and match(win32.window_title(hwnd))):
+        hwnd = win32.find_window(match)
+        if not hwnd:
+            _HWND_CACHE.pop(title, None)
+            return False
+        _HWND_CACHE[title] = hwnd
+    return win32.activate_window(hwnd)
+
+
+# Fallback when SetForegroundWindow is refused.
+# title_re -> connected pywinauto Application; UIA connect walks the whole
+# desktop tree, so it is only repeated when the cached handle goes stale.
+_APP_CACHE: Dict[str, Any] = {}
+
+
+def _cached_top_window(title: str) -> Any:
+    app = _APP_CACHE.get(title)
+    if app is not None:
+        try:
+            win = app.top_window()
+            if win.exists(timeout=0):
+                return win
+        except Exception:
+            pass
+    from pywinauto import Application  # type: ignore
+    app = Application(backend="uia").connect(title_re=title)
+    _APP_CACHE[title] = app
+    return app.top_window()
+
+
+@dataclass(slots=True)
 class MouseClickAction(BaseAction):
     x: Optional[int] = None
     y: Optional[int] = None
@@ -232,13 +272,15 @@ class MouseClickAction(BaseAction):
 
     def run(self, ctx: "RunContext") -> None:
         # Prefer pynput for mouse where available; fallback to pyautogui
-        m_ctrl_cls, m_btn_mod = _get_pynput_mouse()
+        controller = _get_pynput_mouse_ctrl()
+        _m_ctrl_cls, m_btn_mod = _get_pynput_mouse()
         btn_name = self.button if self.button in ("left", "right", "middle") else "left"
         count = max(1, int(self.clicks or 1))
         ctx.log(f"mouse_click: x={self.x}, y={self.y}, button={btn_name}, clicks={count}")
-        if m_ctrl_cls is not None and m_btn_mod is not None:
+        if sys.platform.startswith("win") and _batch_mouse_click(self.x, self.y, btn_name, count):
+            return
+        if controller is not None and m_btn_mod is not None:
             try:
-                controller = m_ctrl_cls()
                 btn = getattr(m_btn_mod, btn_name)
                 if self.x is not None and self.y is not None:
                     # This will move the cursor (OS limitation for targeted clicks)
@@ -249,8 +291,10 @@ class MouseClickAction(BaseAction):
             except Exception as e:  # pragma: no cover
                 ctx.log(f"pynput mouse_click failed, fallback to pyautogui: {e}")
         # Fallback: pyautogui
+        pyautogui = _get_pyautogui()
+        if pyautogui is None:
+            raise ActionError("mouse_click failed: no mouse backend available (install pynput or pyautogui)")
         try:
-            import pyautogui  # local import to avoid hard dep at import time
             if self.x is not None and self.y is not None:
                 for _ in range(count):
                     pyautogui.click(x=int(self.x), y=int(self.y), button=btn_name)
@@ -261,7 +305,7 @@ class MouseClickAction(BaseAction):
             raise ActionError(f"mouse_click failed: {e}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrollAction(BaseAction):
     amount: int = 0
     horizontal: bool = False
@@ -270,10 +314,9 @@ class ScrollAction(BaseAction):
         amt = int(self.amount or 0)
         ctx.log(f"scroll: amount={amt}, horizontal={self.horizontal}")
         # Prefer pynput where available
-        m_ctrl_cls, _m_btn_mod = _get_pynput_mouse()
-        if m_ctrl_cls is not None:
+        controller = _get_pynput_mouse_ctrl()
+        if controller is not None:
             try:
-                controller = m_ctrl_cls()
                 if self.horizontal:
                     controller.scroll(amt, 0)
                 else:
@@ -282,8 +325,10 @@ class ScrollAction(BaseAction):
             except Exception as e:  # pragma: no cover
                 ctx.log(f"pynput scroll failed, fallback to pyautogui: {e}")
         # Fallback to pyautogui
+        pyautogui = _get_pyautogui()
+        if pyautogui is None:
+            raise ActionError("scroll failed: no mouse backend available (install pynput or pyautogui)")
         try:
-            import pyautogui  # local import
             if self.horizontal:
                 pyautogui.hscroll(amt)
             else:
@@ -292,6 +337,66 @@ class ScrollAction(BaseAction):
             raise ActionError(f"scroll failed: {e}")
 
 
+def _parse_launch_process(data: Dict[str, Any]) -> BaseAction:
+    return LaunchProcessAction(
+        command=str(data.get("command")),
+        args=list(data.get("args", [])),
+        cwd=data.get("cwd"),
+        wait=float(data.get("wait", 0.0) or 0.0),
+    )
+
+
+def _parse_wait(data: Dict[str, Any]) -> BaseAction:
+    return WaitAction(milliseconds=int(data.get("milliseconds", 0) or 0))
+
+
+def _parse_send_keys(data: Dict[str, Any]) -> BaseAction:
+    return SendKeysAction(
+        sequence=str(data.get("sequence", "")),
+        post_delay=_optional_float(data.get("post_delay")),
+    )
+
+
+def _parse_type_text(data: Dict[str, Any]) -> BaseAction:
+    return TypeTextAction(
+        text=str(data.get("text", "")),
+        pause=float(data.get("pause", 0.0) or 0.0),
+        post_delay=_optional_float(data.get("post_delay")),
+    )
+
+
+def _parse_window_activate(data: Dict[str, Any]) -> BaseAction:
+    return WindowActivateAction(title=str(data.get("title", "")))
+
+
+def _parse_mouse_click(data: Dict[str, Any]) -> BaseAction:
+    return MouseClickAction(
+        x=data.get("x"),
+        y=data.get("y"),
+        button=str(data.get("button", "left") or "left"),
+        clicks=int(data.get("clicks", 1) or 1),
+    )
+
+
+def _parse_scroll(data: Dict[str, Any]) -> BaseAction:
+    return ScrollAction(
+        amount=int(data.get("amount", 0) or 0),
+        horizontal=bool(data.get("horizontal", False)),
+    )
+
+
+# JSON "type" -> parser; new action types only need an entry here
+_ACTION_REGISTRY: Dict[str, Callable[[Dict[str, Any]], BaseAction]] = {
+    "launch_process": _parse_launch_process,
+    "wait": _parse_wait,
+    "send_keys": _parse_send_keys,
+    "type_text": _parse_type_text,
+    "window_activate": _parse_window_activate,
+    "mouse_click": _parse_mouse_click,
+    "scroll": _parse_scroll,
+}
+
+
 class RunContext:
     """Small helper object passed to actions at runtime."""
 
@@ -310,12 +415,35 @@ class RunContext:
         if self._sleep:
             self._sleep(seconds)
         else:
-            time.sleep(seconds)
+            _precise_sleep(seconds)
 
     def sleep_ms(self, ms: int) -> None:
         self.sleep(max(ms, 0) / 1000.0)
 
 
+# time.sleep() only wakes on the scheduler tick on Windows before Python 3.11
+# (which sleeps on a high-resolution waitable timer); Linux and macOS already
+# wake within ~50-100 µs, where spinning would just burn a core.
+_COARSE_SLEEP = sys.platform.startswith("win") and sys.version_info < (3, 11)
+
+# Below this, a coarse time.sleep() may overshoot by a whole scheduler tick; spin instead
+_SPIN_THRESHOLD = 0.002
+
+
+def _precise_sleep(seconds: float) -> None:
+    """Sleep with sub-millisecond accuracy; spins on perf_counter only where time.sleep() is coarse."""
+    if seconds <= 0:
+        return
+    if not _COARSE_SLEEP:
+        time.sleep(seconds)
+        return
+    deadline = time.perf_counter() + seconds
+    if seconds > _SPIN_THRESHOLD:
+        time.sleep(seconds - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
 def _get_pynput() -> Tuple[Optional[Any], Optional[Any]]:
     """Import pynput lazily and return (KeyboardControllerClass, KeyModule)."""
     try:
@@ -334,6 +462,233 @@ def _get_pynput_mouse() -> Tuple[Optional[Any], Optional[Any]]:
         return None, None
 
 
+_PYNPUT_TOKEN_MAP: Optional[Dict[str, Any]] = None
+
+
+def _get_pynput_token_map() -> Optional[Dict[str, Any]]:
+    """Map send_keys tokens to pynput keys; built once after pynput imports."""
+    global _PYNPUT_TOKEN_MAP
+    if _PYNPUT_TOKEN_MAP is None:
+        _kb_cls, key_mod = _get_pynput()
+        if key_mod is None:
+            return None
+        _PYNPUT_TOKEN_MAP = {
+            "<ENTER>": getattr(key_mod, "enter", None),
+            "<TAB>": getattr(key_mod, "tab", None),
+            "<ESC>": getattr(key_mod, "esc", None),
+            "<BACKSPACE>": getattr(key_mod, "backspace", None),
+            "<DELETE>": getattr(key_mod, "delete", None),
+            "<HOME>": getattr(key_mod, "home", None),
+            "<END>": getattr(key_mod, "end", None),
+            "<PAGE_UP>": getattr(key_mod, "page_up", None),
+            "<PAGE_DOWN>": getattr(key_mod, "page_down", None),
+            "<UP>": getattr(key_mod, "up", None),
+            "<DOWN>": getattr(key_mod, "down", None),
+            "<LEFT>": getattr(key_mod, "left", None),
+            "<RIGHT>": getattr(key_mod, "right", None),
+            "<SPACE>": " ",
+        }
+    return _PYNPUT_TOKEN_MAP
+
+
+# Controllers open platform handles (X display, event source, keyboard layout)
+# when constructed, so one instance of each is shared by all actions.
+_KB_SINGLETON: Optional[Any] = None
+_MOUSE_SINGLETON: Optional[Any] = None
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def _get_pynput_kb() -> Optional[Any]:
+    """Return the shared pynput keyboard Controller, or None if pynput is unavailable."""
+    global _KB_SINGLETON
+    if _KB_SINGLETON is None:
+        with _CONTROLLER_LOCK:
+            if _KB_SINGLETON is None:
+                kb_cls, _key_mod = _get_pynput()
+                if kb_cls is not None:
+                    try:
+                        _KB_SINGLETON = kb_cls()
+                    except Exception:
+                        return None
+    return _KB_SINGLETON
+
+
+def _get_pynput_mouse_ctrl() -> Optional[Any]:
+    """Return the shared pynput mouse Controller, or None if pynput is unavailable."""
+    global _MOUSE_SINGLETON
+    if _MOUSE_SINGLETON is None:
+        with _CONTROLLER_LOCK:
+            if _MOUSE_SINGLETON is None:
+                m_ctrl_cls, _m_btn_mod = _get_pynput_mouse()
+                if m_ctrl_cls is not None:
+                    try:
+                        _MOUSE_SINGLETON = m_ctrl_cls()
+                    except Exception:
+                        return None
+    return _MOUSE_SINGLETON
+
+
+# Named tokens -> (virtual key, needs KEYEVENTF_EXTENDEDKEY)
+_WIN32_TOKEN_KEYS: Dict[str, Tuple[int, bool]] = {
+    "<ENTER>": (win32.VK_RETURN, False),
+    "<TAB>": (win32.VK_TAB, False),
+    "<ESC>": (win32.VK_ESCAPE, False),
+    "<BACKSPACE>": (win32.VK_BACK, False),
+    "<DELETE>": (win32.VK_DELETE, True),
+    "<HOME>": (win32.VK_HOME, True),
+    "<END>": (win32.VK_END, True),
+    "<PAGE_UP>": (win32.VK_PRIOR, True),
+    "<PAGE_DOWN>": (win32.VK_NEXT, True),
+    "<UP>": (win32.VK_UP, True),
+    "<DOWN>": (win32.VK_DOWN, True),
+    "<LEFT>": (win32.VK_LEFT, True),
+    "<RIGHT>": (win32.VK_RIGHT, True),
+    "<SPACE>": (win32.VK_SPACE, False),
+}
+
+
+def _sequence_events(sequence: str) -> List[win32.KeyEvent]:
+    """Translate a send_keys sequence into keyboard events (same tokens as pynput)."""
+    events: List[win32.KeyEvent] = []
+    for token in _tokenize_keys(sequence):
+        named = _WIN32_TOKEN_KEYS.get(token)
+        if named is None:
+            events.extend(win32.unicode_events(token))
+        else:
+            vk, extended = named
+            events.extend(win32.key_press_events(vk, extended=extended, scan=win32.scan_code(vk)))
+    return events
+
+
+def _text_events(text: str) -> List[win32.KeyEvent]:
+    """Translate literal text into keyboard events; newlines become Enter."""
+    events: List[win32.KeyEvent] = []
+    for line_no, line in enumerate(text.replace("\r\n", "\n").split("\n")):
+        if line_no:
+            events.extend(win32.key_press_events(win32.VK_RETURN, scan=win32.scan_code(win32.VK_RETURN)))
+        if line:
+            events.extend(win32.unicode_events(line))
+    return events
+
+
+# Built INPUT buffers are cached per string so looped scripts (repeat /
+# until_stopped) only pay for tokenizing and packing on the first iteration.
+# SendInput never writes to the buffer, so sharing cached arrays is safe.
+@functools.lru_cache(maxsize=256)
+def _sequence_buffer(sequence: str) -> "ctypes.Array[win32.INPUT]":
+    return win32.build_keyboard_buffer(_sequence_events(sequence))
+
+
+@functools.lru_cache(maxsize=256)
+def _text_buffer(text: str) -> "ctypes.Array[win32.INPUT]":
+    return win32.build_keyboard_buffer(_text_events(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _ascii_buffer(text: str, hkl: int) -> "ctypes.Array[win32.INPUT]":
+    return win32.build_keyboard_buffer(_build_ascii_inputs(text, hkl))
+
+
+def _build_ascii_inputs(text: str, hkl: int) -> List[win32.KeyEvent]:
+    """Type ASCII text as layout scan codes (KEYEVENTF_SCANCODE), adding Shift where needed.
+
+    Characters the layout can't produce without Ctrl/Alt fall back to Unicode events.
+    """
+    scancode = win32.KEYEVENTF_SCANCODE
+    keyup = win32.KEYEVENTF_KEYUP
+    shift_scan = win32.scan_code(win32.VK_SHIFT)
+    events: List[win32.KeyEvent] = []
+    for ch in text.replace("\r\n", "\n"):
+        if ch in "\r\n":
+            events.extend(win32.key_press_events(win32.VK_RETURN, scan=win32.scan_code(win32.VK_RETURN)))
+            continue
+        key = win32.char_key(ch, hkl)
+        if key is None:
+            events.extend(win32.unicode_events(ch))
+            continue
+        vk, scan, shift = key
+        if shift:
+            events.append((0, shift_scan, scancode))
+        events.append((0, scan, scancode))
+        events.append((0, scan, scancode | keyup))
+        if shift:
+            events.append((0, shift_scan, scancode | keyup))
+    return events
+
+
+def _typing_buffer(text: str) -> "ctypes.Array[win32.INPUT]":
+    """ASCII text goes out as scan codes for the active layout, anything else as Unicode.
+
+    With Caps Lock on, scan codes would invert the case, so the text is sent as Unicode.
+    """
+    if text.isascii() and not win32.caps_lock_on():
+        hkl = win32.keyboard_layout()
+        if hkl:
+            return _ascii_buffer(text, hkl)
+    return _text_buffer(text)
+
+
+def _send_input_win32(buffer: "ctypes.Array[win32.INPUT]") -> bool:
+    """Submit a prepared buffer through a single SendInput call.
+
+    Returns True when every event was injected and False when none was (the
+    caller may fall back to another backend). A partial injection cannot be
+    retried without retyping the delivered part, so it releases the modifier
+    keys (a scan-code Shift may still be down) and raises ActionError.
+    """
+    count = len(buffer)
+    if count == 0:
+        return False
+    sent = win32.send_input(buffer)
+    if sent == count:
+        return True
+    if sent == 0:
+        return False
+    win32.release_modifiers()
+    raise ActionError(f"SendInput injected only {sent} of {count} keyboard events")
+
+
+# Heavy optional imports are resolved once; a failed import is not retried.
+_PW_SEND_KEYS: Optional[Callable[..., Any]] = None
+_PW_IMPORT_TRIED = False
+_PYAUTOGUI: Optional[Any] = None
+_PYAUTOGUI_IMPORT_TRIED = False
+
+
+def _get_pw_send_keys() -> Optional[Callable[..., Any]]:
+    """Import pywinauto.keyboard.send_keys on first use (pulls in comtypes)."""
+    global _PW_SEND_KEYS, _PW_IMPORT_TRIED
+    if not _PW_IMPORT_TRIED:
+        try:
+            from pywinauto.keyboard import send_keys as pw_send_keys  # type: ignore
+            _PW_SEND_KEYS = pw_send_keys
+        except Exception:
+            _PW_SEND_KEYS = None
+        _PW_IMPORT_TRIED = True
+    return _PW_SEND_KEYS
+
+
+def _get_pyautogui() -> Optional[Any]:
+    """Import pyautogui on first use; it probes the display at import time."""
+    global _PYAUTOGUI, _PYAUTOGUI_IMPORT_TRIED
+    if not _PYAUTOGUI_IMPORT_TRIED:
+        try:
+            import pyautogui  # type: ignore
+            _PYAUTOGUI = pyautogui
+        except Exception:
+            _PYAUTOGUI = None
+        _PYAUTOGUI_IMPORT_TRIED = True
+    return _PYAUTOGUI
+
+
+def _batch_mouse_click(x: Optional[int], y: Optional[int], button: str, count: int) -> bool:
+    """Windows: move once, then submit all ``count`` clicks in a single SendInput call."""
+    if x is not None and y is not None and not win32.set_cursor_pos(int(x), int(y)):
+        return False
+    buffer = win32.mouse_click_buffer(button, count)
+    return win32.send_input(buffer) == len(buffer)
+
+
 def _try_pywinauto_send_keys(text: str, ctx: "RunContext", *, pause: float = 0.0) -> bool:
     """Try to send keys via pywinauto on Windows; return True on success.
 
@@ -341,8 +696,11 @@ def _try_pywinauto_send_keys(text: str, ctx: "RunContext", *, pause: float = 0.0
     """
     if not sys.platform.startswith("win"):
         return False
+    pw_send_keys = _get_pw_send_keys()
+    if pw_send_keys is None:
+        ctx.log("pywinauto send_keys failed: pywinauto is not installed")
+        return False
     try:
-        from pywinauto.keyboard import send_keys as pw_send_keys  # type: ignore
         # Use a tiny non-zero pause to avoid dropped characters in some apps
         pw_send_keys(text, with_spaces=True, pause=max(0.0, float(pause)))
         return True
@@ -1,23 +1,90 @@
 """
-Automation engine that executes an AutomationScript in a worker thread.
+Automation engine that executes AutomationScripts on a persistent worker thread.
 """
 
 from __future__ import annotations
 
+import queue
 import threading
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
-from .actions import RunContext
+from . import win32
+from .actions import BaseAction, RunContext, SendKeysAction, TypeTextAction
 from .script_model import AutomationScript
 
 
+def _open_ended(sequence: str) -> bool:
+    """True if the end of ``sequence`` could combine with whatever follows it.
+
+    Covers an unclosed ``<`` token and, for the pywinauto fallback, a trailing
+    modifier (+ ^ %) or an unclosed ``{`` / ``(`` group.
+    """
+    return (
+        sequence.endswith(("+", "^", "%"))
+        or sequence.rfind("<") > sequence.rfind(">")
+        or sequence.rfind("{") > sequence.rfind("}")
+        or sequence.rfind("(") > sequence.rfind(")")
+    )
+
+
+def _fuse(prev: BaseAction, action: BaseAction) -> Optional[BaseAction]:
+    """Merge two adjacent keyboard actions into one, or return None.
+
+    Only actions of the same kind are merged, so the result takes the same
+    backend path as the originals: send_keys sequences are concatenated without
+    a separator (pywinauto would type one) unless the first one is open-ended,
+    and type_text keeps the scan-code path for ASCII text (mixed
+    ASCII/non-ASCII text would switch the ASCII part to Unicode events).
+    """
+    if isinstance(prev, SendKeysAction) and isinstance(action, SendKeysAction):
+        if prev.post_delay is not None or _open_ended(prev.sequence):
+            return None
+        return SendKeysAction(sequence=prev.sequence + action.sequence, post_delay=action.post_delay)
+    if (
+        isinstance(prev, TypeTextAction)
+        and isinstance(action, TypeTextAction)
+        and prev.post_delay is None
+        and prev.pause == action.pause
+        and prev.text.isascii() == action.text.isascii()
+    ):
+        return TypeTextAction(text=prev.text + action.text, pause=action.pause, post_delay=action.post_delay)
+    return None
+
+
+def _optimize_actions(actions: List[BaseAction]) -> List[BaseAction]:
+    """Fuse adjacent type_text actions (and adjacent send_keys actions) into single batches.
+
+    Only the default stabilisation tail between two keyboard actions is dropped;
+    an explicit post_delay marks a deliberate pause and is never merged across.
+    """
+    optimized: List[BaseAction] = []
+    for action in actions:
+        fused = _fuse(optimized[-1], action) if optimized else None
+        if fused is not None:
+            optimized[-1] = fused
+        else:
+            optimized.append(action)
+    return optimized
+
+
 class AutomationEngine:
-    def __init__(self, script: AutomationScript):
+    """Runs scripts on one long-lived worker thread fed by a queue.
+
+    ``start`` only enqueues, so repeated runs reuse the same thread; ``close``
+    shuts the worker down.
+    """
+
+    def __init__(self, script: Optional[AutomationScript] = None):
         self._script = script
+        self._optimized_actions = _optimize_actions(list(script.actions)) if script else []
+        self._queue: "queue.SimpleQueue[Optional[tuple[AutomationScript, List[BaseAction]]]]" = queue.SimpleQueue()
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
         self._on_log: Optional[Callable[[str], None]] = None
         self._on_done: Optional[Callable[[bool, str], None]] = None
+        self._timer_period_active = False
 
     def on_log(self, cb: Callable[[str], None]) -> None:
         self._on_log = cb
@@ -25,20 +92,42 @@ class AutomationEngine:
     def on_done(self, cb: Callable[[bool, str], None]) -> None:
         self._on_done = cb
 
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+    def start(self, script: Optional[AutomationScript] = None) -> None:
+        """Queue a run of ``script`` (or the current script) unless one is in progress."""
+        if not self._idle.is_set():
             return
+        if script is not None:
+            self._script = script
+            self._optimized_actions = _optimize_actions(list(script.actions))
+        if self._script is None:
+            raise ValueError("AutomationEngine.start: no script loaded")
         self._stop.clear()
-        self._thread = threading.Thread(target=self._worker, daemon=True)
-        self._thread.start()
+        self._idle.clear()
+        # 1 ms timer resolution for the duration of the run so short waits are accurate
+        self._timer_period_active = win32.begin_timer_period(1)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+        self._queue.put((self._script, self._optimized_actions))
 
     def cancel(self) -> None:
         self._stop.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2.0)
+        self._idle.wait(timeout=2.0)
 
     def is_running(self) -> bool:
-        return bool(self._thread and self._thread.is_alive())
+        return not self._idle.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the current run finishes; return False on timeout."""
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        """Cancel any run and stop the worker thread."""
+        self.cancel()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=2.0)
+        self._thread = None
 
     def _log(self, msg: str) -> None:
         if self._on_log:
@@ -49,28 +138,45 @@ class AutomationEngine:
 
     def _worker(self) -> None:
         ctx = RunContext(logger=self._log)
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            script, actions = job
+            self._run(ctx, script, actions)
+
+    def _run(self, ctx: RunContext, script: AutomationScript, actions: List[BaseAction]) -> None:
+        stop = self._stop
         try:
             iteration = 0
-            total_actions = len(self._script.actions)
+            total_actions = len(actions)
+            # Per-action log lines are built once, and only when someone will read them
+            prefixes: Optional[List[str]] = None
+            if self._on_log is not None and getattr(script, "debug", False):
+                prefixes = [
+                    f"[{idx+1}/{total_actions}] {action.__class__.__name__}"
+                    for idx, action in enumerate(actions)
+                ]
             # Determine loop behavior
-            repeat_until_stopped = bool(getattr(self._script, "repeat_until_stopped", False))
-            max_repeats = getattr(self._script, "repeat_count", None)
+            repeat_until_stopped = bool(getattr(script, "repeat_until_stopped", False))
+            max_repeats = getattr(script, "repeat_count", None)
             if not repeat_until_stopped and (max_repeats is None or max_repeats < 1):
                 max_repeats = 1
-            while not self._stop.is_set():
+            while not stop.is_set():
                 iteration += 1
                 self._log(f"Loop {iteration}")
-                for idx, action in enumerate(self._script.actions):
-                    if self._stop.is_set():
+                for idx, action in enumerate(actions):
+                    if stop.is_set():
                         self._finish(False, "Aborted")
                         return
-                    self._log(f"[{idx+1}/{total_actions}] {action.__class__.__name__}")
+                    if prefixes is not None:
+                        self._log(prefixes[idx])
                     action.run(ctx)
                 # End of one iteration
                 if not repeat_until_stopped:
                     if max_repeats is not None and iteration >= max_repeats:
                         break
-            if self._stop.is_set():
+            if stop.is_set():
                 self._finish(False, "Aborted")
             else:
                 done_msg = "Completed" if (not repeat_until_stopped) else "Stopped"
@@ -79,8 +185,14 @@ class AutomationEngine:
             self._finish(False, f"Error: {e}")
 
     def _finish(self, ok: bool, msg: str) -> None:
-        if self._on_done:
-            try:
-                self._on_done(ok, msg)
-            except Exception:
-                pass
+        if self._timer_period_active:
+            self._timer_period_active = False
+            win32.end_timer_period(1)
+        try:
+            if self._on_done:
+                try:
+                    self._on_done(ok, msg)
+                except Exception:
+                    pass
+        finally:
+            self._idle.set()
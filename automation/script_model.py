@@ -5,11 +5,24 @@ Automation script data model and JSON parser.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+import json
+from typing import List, Dict, Any, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
 from .actions import BaseAction
 
 
+def loads_json(raw: Union[str, bytes]) -> Any:
+    """Parse script JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class AutomationScript:
     name: str
@@ -17,6 +30,11 @@ class AutomationScript:
     # Optional loop configuration
     repeat_count: Optional[int] = None  # None means run once; >=1 run that many times
     repeat_until_stopped: bool = False  # when True, ignore repeat_count and run until cancel
+    debug: bool = False  # log every action as it runs
+
+    @staticmethod
+    def from_json(raw: Union[str, bytes]) -> "AutomationScript":
+        return AutomationScript.from_dict(loads_json(raw))
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "AutomationScript":
@@ -24,9 +42,8 @@ class AutomationScript:
         actions_data = data.get("actions", []) or []
         actions: List[BaseAction] = []
         if isinstance(actions_data, list):
-            for raw in actions_data:
-                if isinstance(raw, dict):
-                    actions.append(BaseAction.from_dict(raw))
+            # Skip malformed entries
+            actions = [BaseAction.from_dict(raw) for raw in actions_data if isinstance(raw, dict)]
         # Loop config: accept either top-level keys or a "loop" object
         repeat_count: Optional[int] = None
         repeat_until_stopped = False
@@ -54,4 +71,5 @@ class AutomationScript:
             actions=actions,
             repeat_count=repeat_count,
             repeat_until_stopped=repeat_until_stopped,
+            debug=bool(data.get("debug", False)),
         )
@@ -0,0 +1,442 @@
+"""
+Thin ctypes bindings for the Win32 APIs used by the automation actions.
+
+The structures are importable on every platform so callers can build input
+buffers unconditionally; only the functions that actually call into user32
+are Windows-specific and report failure (0/False) elsewhere.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import functools
+import sys
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+IS_WINDOWS = sys.platform.startswith("win")
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+KEYEVENTF_SCANCODE = 0x0008
+
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_MIDDLEDOWN = 0x0020
+MOUSEEVENTF_MIDDLEUP = 0x0040
+
+# Button name -> (down flag, up flag)
+MOUSE_BUTTON_FLAGS = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+}
+
+MAPVK_VK_TO_VSC = 0
+MAPVK_VK_TO_CHAR = 2
+# Set in the MAPVK_VK_TO_CHAR result when the key is a dead key
+DEAD_KEY_FLAG = 0x80000000
+
+SW_RESTORE = 9
+
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+VK_SHIFT = 0x10
+VK_CONTROL = 0x11
+VK_MENU = 0x12
+VK_CAPITAL = 0x14
+VK_BACK = 0x08
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+VK_ESCAPE = 0x1B
+VK_SPACE = 0x20
+VK_PRIOR = 0x21
+VK_NEXT = 0x22
+VK_END = 0x23
+VK_HOME = 0x24
+VK_LEFT = 0x25
+VK_UP = 0x26
+VK_RIGHT = 0x27
+VK_DOWN = 0x28
+VK_DELETE = 0x2E
+
+# One keyboard event as (virtual key, scan code, flags); hashable so whole
+# sequences of events can be cached.
+KeyEvent = Tuple[int, int, int]
+
+ULONG_PTR = ctypes.c_size_t
+HWND = ctypes.c_void_p
+# BOOL CALLBACK EnumWindowsProc(HWND, LPARAM)
+WNDENUMPROC = ctypes.CFUNCTYPE(ctypes.c_int, HWND, ctypes.c_ssize_t)
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", ctypes.c_uint32),
+        ("wParamL", ctypes.c_uint16),
+        ("wParamH", ctypes.c_uint16),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_uint32), ("u", _INPUTUNION)]
+
+
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_int32), ("y", ctypes.c_int32)]
+
+
+_USER32: Optional[Any] = None
+_WINMM: Optional[Any] = None
+
+
+def _user32() -> Optional[Any]:
+    """Load user32 once and declare the prototypes we call."""
+    global _USER32
+    if _USER32 is None and IS_WINDOWS:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)  # type: ignore[attr-defined]
+        user32.SendInput.argtypes = (ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int)
+        user32.SendInput.restype = ctypes.c_uint
+        user32.MapVirtualKeyW.argtypes = (ctypes.c_uint, ctypes.c_uint)
+        user32.MapVirtualKeyW.restype = ctypes.c_uint
+        user32.MapVirtualKeyExW.argtypes = (ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p)
+        user32.MapVirtualKeyExW.restype = ctypes.c_uint
+        user32.VkKeyScanExW.argtypes = (ctypes.c_wchar, ctypes.c_void_p)
+        user32.VkKeyScanExW.restype = ctypes.c_short
+        user32.GetForegroundWindow.argtypes = ()
+        user32.GetForegroundWindow.restype = HWND
+        user32.GetWindowThreadProcessId.argtypes = (HWND, ctypes.c_void_p)
+        user32.GetWindowThreadProcessId.restype = ctypes.c_uint32
+        user32.GetKeyboardLayout.argtypes = (ctypes.c_uint32,)
+        user32.GetKeyboardLayout.restype = ctypes.c_void_p
+        user32.GetKeyState.argtypes = (ctypes.c_int,)
+        user32.GetKeyState.restype = ctypes.c_short
+        user32.SetCursorPos.argtypes = (ctypes.c_int, ctypes.c_int)
+        user32.SetCursorPos.restype = ctypes.c_int
+        user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+        user32.GetSystemMetrics.restype = ctypes.c_int
+        user32.GetCursorPos.argtypes = (ctypes.POINTER(POINT),)
+        user32.GetCursorPos.restype = ctypes.c_int
+        user32.EnumWindows.argtypes = (WNDENUMPROC, ctypes.c_ssize_t)
+        user32.EnumWindows.restype = ctypes.c_int
+        user32.GetWindowTextLengthW.argtypes = (HWND,)
+        user32.GetWindowTextLengthW.restype = ctypes.c_int
+        user32.GetWindowTextW.argtypes = (HWND, ctypes.c_wchar_p, ctypes.c_int)
+        user32.GetWindowTextW.restype = ctypes.c_int
+        for name in ("IsWindow", "IsWindowVisible", "IsIconic", "SetForegroundWindow"):
+            getattr(user32, name).argtypes = (HWND,)
+            getattr(user32, name).restype = ctypes.c_int
+        user32.ShowWindow.argtypes = (HWND, ctypes.c_int)
+        user32.ShowWindow.restype = ctypes.c_int
+        _USER32 = user32
+    return _USER32
+
+
+def get_user32() -> Optional[Any]:
+    """The prototyped user32 handle, for callers that want to bind functions once."""
+    return _user32()
+
+
+def _winmm() -> Optional[Any]:
+    """Load winmm once (multimedia timer resolution)."""
+    global _WINMM
+    if _WINMM is None and IS_WINDOWS:
+        winmm = ctypes.WinDLL("winmm")  # type: ignore[attr-defined]
+        winmm.timeBeginPeriod.argtypes = (ctypes.c_uint,)
+        winmm.timeBeginPeriod.restype = ctypes.c_uint
+        winmm.timeEndPeriod.argtypes = (ctypes.c_uint,)
+        winmm.timeEndPeriod.restype = ctypes.c_uint
+        _WINMM = winmm
+    return _WINMM
+
+
+def begin_timer_period(ms: int = 1) -> bool:
+    """Raise the system timer resolution to ``ms``; pair every True with end_timer_period."""
+    winmm = _winmm()
+    if winmm is None:
+        return False
+    try:
+        return int(winmm.timeBeginPeriod(ms)) == 0  # TIMERR_NOERROR
+    except Exception:  # pragma: no cover - platform specific
+        return False
+
+
+def end_timer_period(ms: int = 1) -> None:
+    """Undo a successful begin_timer_period call."""
+    winmm = _winmm()
+    if winmm is None:
+        return
+    try:
+        winmm.timeEndPeriod(ms)
+    except Exception:  # pragma: no cover - platform specific
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def scan_code(vk: int) -> int:
+    """Hardware scan code for a virtual key (0 when unknown); resolved once per key."""
+    user32 = _user32()
+    if user32 is None:
+        return 0
+    try:
+        return int(user32.MapVirtualKeyW(vk, MAPVK_VK_TO_VSC))
+    except Exception:  # pragma: no cover - platform specific
+        return 0
+
+
+def keyboard_layout() -> int:
+    """HKL of the foreground window's thread (the layout that will receive input); 0 elsewhere."""
+    user32 = _user32()
+    if user32 is None:
+        return 0
+    try:
+        thread_id = user32.GetWindowThreadProcessId(user32.GetForegroundWindow(), None)
+        return int(user32.GetKeyboardLayout(thread_id) or 0)
+    except Exception:  # pragma: no cover - platform specific
+        return 0
+
+
+def caps_lock_on() -> bool:
+    """True when Caps Lock is toggled on (False where unknown)."""
+    user32 = _user32()
+    if user32 is None:
+        return False
+    try:
+        return bool(user32.GetKeyState(VK_CAPITAL) & 1)
+    except Exception:  # pragma: no cover - platform specific
+        return False
+
+
+@functools.lru_cache(maxsize=1024)
+def char_key(ch: str, hkl: int) -> Optional[Tuple[int, int, bool]]:
+    """Map a character to (vk, scan, needs_shift) on layout ``hkl``.
+
+    Returns None when the character has no key on the layout, needs
+    Ctrl/Alt (AltGr) to produce or sits on a dead key (which would compose
+    with the next character), in which case callers type it as Unicode.
+    """
+    user32 = _user32()
+    if user32 is None:
+        return None
+    try:
+        res = int(user32.VkKeyScanExW(ch, hkl))
+    except Exception:  # pragma: no cover - platform specific
+        return None
+    if res == -1:
+        return None
+    vk, state = res & 0xFF, (res >> 8) & 0xFF
+    if state & 0x06:
+        return None
+    if int(user32.MapVirtualKeyExW(vk, MAPVK_VK_TO_CHAR, hkl)) & DEAD_KEY_FLAG:
+        return None
+    scan = int(user32.MapVirtualKeyExW(vk, MAPVK_VK_TO_VSC, hkl))
+    if not scan:
+        return None
+    return vk, scan, bool(state & 0x01)
+
+
+def key_press_events(vk: int, *, extended: bool = False, scan: int = 0) -> List[KeyEvent]:
+    """Return the down/up event pair for a virtual key."""
+    flags = KEYEVENTF_EXTENDEDKEY if extended else 0
+    return [(vk, scan, flags), (vk, scan, flags | KEYEVENTF_KEYUP)]
+
+
+def unicode_events(text: str) -> List[KeyEvent]:
+    """Return down/up pairs that type ``text`` literally (layout independent).
+
+    Characters outside the BMP are sent as their UTF-16 surrogate pair, which is
+    what the receiving window expects for KEYEVENTF_UNICODE input.
+    """
+    raw = text.encode("utf-16-le")
+    events: List[KeyEvent] = []
+    for i in range(0, len(raw), 2):
+        unit = raw[i] | (raw[i + 1] << 8)
+        events.append((0, unit, KEYEVENTF_UNICODE))
+        events.append((0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return events
+
+
+def build_keyboard_buffer(events: Sequence[KeyEvent]) -> "ctypes.Array[INPUT]":
+    """Pack keyboard events into a pre-sized INPUT array for SendInput."""
+    buffer = (INPUT * len(events))()
+    for slot, (vk, scan, flags) in zip(buffer, events):
+        slot.type = INPUT_KEYBOARD
+        slot.ki.wVk = vk
+        slot.ki.wScan = scan
+        slot.ki.dwFlags = flags
+    return buffer
+
+
+def _mouse_event_bytes(flags: int) -> bytes:
+    event = INPUT(type=INPUT_MOUSE)
+    event.mi.dwFlags = flags
+    return bytes(event)
+
+
+# One serialized down+up INPUT pair per button, built once at import. Click
+# buffers are copies of these bytes; nothing is written field by field later.
+CLICK_PAYLOADS = {
+    name: _mouse_event_bytes(down) + _mouse_event_bytes(up)
+    for name, (down, up) in MOUSE_BUTTON_FLAGS.items()
+}
+
+
+@functools.lru_cache(maxsize=32)
+def mouse_click_buffer(button: str, count: int) -> "ctypes.Array[INPUT]":
+    """Return a cached INPUT array with ``count`` down/up pairs for ``button``.
+
+    SendInput only reads the array, so the same buffer is reused for every click.
+    """
+    payload = CLICK_PAYLOADS.get(button, CLICK_PAYLOADS["left"])
+    return (INPUT * (2 * count)).from_buffer_copy(payload * count)
+
+
+def set_cursor_pos(x: int, y: int) -> bool:
+    """Move the cursor to virtual-screen coordinates; return True on success."""
+    user32 = _user32()
+    if user32 is None:
+        return False
+    try:
+        return bool(user32.SetCursorPos(int(x), int(y)))
+    except Exception:  # pragma: no cover - platform specific
+        return False
+
+
+def cursor_position() -> Optional[Tuple[int, int]]:
+    """Current cursor position in virtual-screen coordinates, or None on failure."""
+    user32 = _user32()
+    if user32 is None:
+        return None
+    pt = POINT()
+    try:
+        if not user32.GetCursorPos(ctypes.byref(pt)):
+            return None
+    except Exception:  # pragma: no cover - platform specific
+        return None
+    return pt.x, pt.y
+
+
+def virtual_screen_rect() -> Optional[Tuple[int, int, int, int]]:
+    """(left, top, width, height) of the desktop spanning all monitors, or None."""
+    user32 = _user32()
+    if user32 is None:
+        return None
+    try:
+        metrics = user32.GetSystemMetrics
+        rect = (
+            metrics(SM_XVIRTUALSCREEN),
+            metrics(SM_YVIRTUALSCREEN),
+            metrics(SM_CXVIRTUALSCREEN),
+            metrics(SM_CYVIRTUALSCREEN),
+        )
+    except Exception:  # pragma: no cover - platform specific
+        return None
+    return rect if rect[2] > 0 and rect[3] > 0 else None
+
+
+def window_title(hwnd: int) -> str:
+    """Return the caption of ``hwnd`` ("" if it has none or on failure)."""
+    user32 = _user32()
+    if user32 is None:
+        return ""
+    length = user32.GetWindowTextLengthW(hwnd)
+    if length <= 0:
+        return ""
+    buf = ctypes.create_unicode_buffer(length + 1)
+    user32.GetWindowTextW(hwnd, buf, length + 1)
+    return buf.value
+
+
+def find_window(match: Callable[[str], Any]) -> int:
+    """Return the first visible top-level window whose title satisfies ``match`` (0 if none)."""
+    user32 = _user32()
+    if user32 is None:
+        return 0
+    found: List[int] = []
+
+    def _visit(hwnd: int, _lparam: int) -> int:
+        if hwnd and user32.IsWindowVisible(hwnd) and match(window_title(hwnd)):
+            found.append(hwnd)
+            return 0  # stop enumerating
+        return 1
+
+    try:
+        user32.EnumWindows(WNDENUMPROC(_visit), 0)
+    except Exception:  # pragma: no cover - platform specific
+        return 0
+    return found[0] if found else 0
+
+
+def is_window(hwnd: int) -> bool:
+    user32 = _user32()
+    return bool(user32 is not None and hwnd and user32.IsWindow(hwnd))
+
+
+def activate_window(hwnd: int) -> bool:
+    """Restore ``hwnd`` if minimized and bring it to the foreground."""
+    user32 = _user32()
+    if user32 is None or not hwnd:
+        return False
+    try:
+        if user32.IsIconic(hwnd):
+            user32.ShowWindow(hwnd, SW_RESTORE)
+        return bool(user32.SetForegroundWindow(hwnd))
+    except Exception:  # pragma: no cover - platform specific
+        return False
+
+
+def release_modifiers() -> None:
+    """Send key-up for Shift, Ctrl and Alt (best-effort), e.g. after a cut-short SendInput batch."""
+    events: List[KeyEvent] = [(0, scan_code(VK_SHIFT), KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP)]
+    for vk in (VK_SHIFT, VK_CONTROL, VK_MENU):
+        events.append((vk, scan_code(vk), KEYEVENTF_KEYUP))
+    send_input(build_keyboard_buffer(events))
+
+
+def send_input(buffer: "ctypes.Array[INPUT]") -> int:
+    """Submit ``buffer`` with one SendInput call; return the number of events injected."""
+    count = len(buffer)
+    if count == 0:
+        return 0
+    user32 = _user32()
+    if user32 is None:
+        return 0
+    try:
+        return int(user32.SendInput(count, buffer, ctypes.sizeof(INPUT)))
+    except Exception:  # pragma: no cover - platform specific
+        return 0
+
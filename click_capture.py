@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 try:
     from pynput import mouse  # type: ignore
@@ -11,16 +11,26 @@ except Exception:  # pragma: no cover - environment dependent
     mouse = None  # type: ignore
 import tkinter as tk
 
+from automation import win32
+
 
 CapturedCallback = Callable[[int, int], None]
 ErrorCallback = Callable[[Exception], None]
-
+# Runs fn(*args) on the Tkinter thread; called from the listener thread
+Dispatcher = Callable[..., None]
 
 class ClickCaptureService:
-    """Listens for the next mouse click and reports it back to the Tkinter thread."""
+    """Listens for the next mouse click and reports it back to the Tkinter thread.
+
+    One pynput listener is started on the first capture and kept running;
+    each capture only arms a pending callback slot. Call ``close`` on shutdown.
+    Results are handed to ``dispatch`` (default ``root.after(0, ...)``), which
+    must run them on the Tkinter thread.
+    """
 
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, dispatch: Optional[Dispatcher] = None) -> None:
         self._root = root
+        self._dispatch: Dispatcher = dispatch or (lambda fn, *args: root.after(0, fn, *args))
         self._listener: Optional[object] = None
         self._lock = threading.Lock()
         self._on_captured: Optional[CapturedCallback] = None
@@ -36,52 +46,71 @@ class ClickCaptureService:
         Returns True if the capture started successfully, or False if a capture is already in progress.
         """
         with self._lock:
-            if self._listener is not None:
+            if self._on_captured is not None:
                 return False
 
-            self._on_captured = on_captured
-            self._on_error = on_error
-
             try:
-                if mouse is None:
-                    raise RuntimeError("pynput/mouse backend not available; Mausaufzeichnung ist deaktiviert.")
-                self._listener = mouse.Listener(on_click=self._handle_click)
-                self._listener.start()
-                return True
+                self._ensure_listener()
             except Exception as exc:  # pragma: no cover - hardware dependent
                 self._listener = None
                 if on_error:
+                    self._on_error = on_error
                     self._notify_error(exc)
                 return False
 
+            self._on_captured = on_captured
+            self._on_error = on_error
+            return True
+
     def cancel(self) -> None:
         """Cancel a pending capture if present."""
         with self._lock:
+            self._on_captured = None
+            self._on_error = None
+
+    def close(self) -> None:
+        """Cancel any pending capture and stop the shared listener."""
+        with self._lock:
+            self._on_captured = None
+            self._on_error = None
             self._stop_listener()
 
     # Internal helpers -------------------------------------------------
 
+    def _ensure_listener(self) -> None:
+        listener = self._listener
+        if listener is not None and listener.is_alive():  # type: ignore[attr-defined]
+            return
+        if mouse is None:
+            raise RuntimeError("pynput/mouse backend not available; Mausaufzeichnung ist deaktiviert.")
+        self._listener = mouse.Listener(on_click=self._handle_click)
+        self._listener.start()  # type: ignore[attr-defined]
+
     def _handle_click(self, x: float, y: float, _button, pressed: bool) -> bool:
-        if not pressed:
+        if not pressed or self._on_captured is None:
             return True
 
-        self._stop_listener()
-
-        # Normalize coordinates using pyautogui to match the coordinate system
-        # used later for clicking. This avoids DPI scaling issues on multi‑monitor
-        # setups (e.g., 4K secondary display with scaling).
-        nx, ny = None, None
-        try:
-            import pyautogui  # type: ignore
-            cx, cy = pyautogui.position()
-            nx, ny = int(cx), int(cy)
-        except Exception:
-            # Fallback to pynput-provided coordinates
-            nx, ny = int(x), int(y)
+        with self._lock:
+            callback = self._on_captured
+            self._on_captured = None
+            self._on_error = None
+        if callback is not None:
+            # Read the position now, while the cursor is still on the clicked
+            # point; only the callback runs later on the Tk thread.
+            self._dispatch(self._safe_invoke, callback, *self._normalize(x, y))
+        return True
 
-        if self._on_captured:
-            self._notify_capture(nx, ny)
-        return False
+    @staticmethod
+    def _normalize(x: float, y: float) -> Tuple[int, int]:
+        # On Windows, take the position from GetCursorPos (microseconds) to match
+        # the coordinate system used later for clicking. This avoids DPI scaling
+        # issues on multi‑monitor setups (e.g., 4K secondary display with scaling).
+        if win32.IS_WINDOWS:
+            position = win32.cursor_position()
+            if position is not None:
+                return position
+        # Fallback to pynput-provided coordinates
+        return int(x), int(y)
 
     def _stop_listener(self) -> None:
         listener = self._listener
@@ -92,11 +121,10 @@ class ClickCaptureService:
             except Exception:
                 pass
 
-    def _notify_capture(self, x: int, y: int) -> None:
-        self._root.after(0, lambda: self._safe_invoke(self._on_captured, x, y))
-
     def _notify_error(self, exc: Exception) -> None:
-        self._root.after(0, lambda: self._safe_invoke(self._on_error, exc))
+        callback = self._on_error
+        self._on_error = None
+        self._dispatch(self._safe_invoke, callback, exc)
 
     @staticmethod
     def _safe_invoke(callback: Optional[Callable], *args) -> None:
@@ -5,12 +5,41 @@ SRP: This class has one responsibility - executing automated clicks.
 It doesn't know about UI, hotkeys, or logging (Dependency Inversion Principle).
 """
 
+import sys
 import time
 import threading
-from typing import Optional, Callable
+from functools import partial
+from itertools import cycle, islice, repeat
+from typing import Optional, Callable, Tuple
 import pyautogui
 
-from models import ClickConfiguration, ClickerState, ClickType, ClickPosition, ClickMode
+from models import ClickConfiguration, ClickerState, ClickType, ClickMode
+from native_click import NativeClicker, cursor_reader
+from precise_timer import TIMER_RESOLUTION, Ticker, make_ticker, raise_thread_priority
+
+# Clicks bypass pyautogui, so its per-call pause and fail-safe would only add
+# work to the remaining pyautogui fallbacks; the engine runs its own fail-safe.
+pyautogui.PAUSE = 0.0
+pyautogui.FAILSAFE = False
+
+# How often the fail-safe watchdog samples the cursor (seconds)
+FAILSAFE_POLL_INTERVAL = 0.05
+
+# Above ~1000 CPS, submit this many clicks per SendInput call
+BURST_CLICKS = 4
+BURST_MAX_DELAY = 0.001
+
+# Click-count updates are sent at most this often (seconds), whatever the CPS
+STATUS_INTERVAL = 0.1
+
+# Delays up to this long are paced by a kernel timer when available; longer
+# ones keep Event.wait so stop() interrupts the sleep immediately.
+TICKER_MAX_DELAY = 0.02
+
+# Lower bound for the delay between clicks, in seconds: the platform's timer
+# resolution, below which pacing degrades into a busy loop. Independent of
+# pyautogui.PAUSE; pass min_delay to AutoClickerEngine to raise it.
+MIN_DELAY = TIMER_RESOLUTION
 
 
 class AutoClickerEngine:
@@ -23,30 +52,51 @@ class AutoClickerEngine:
     - Clear separation of concerns
     """
     
-    def __init__(self, configuration: ClickConfiguration):
+    def __init__(
+        self,
+        configuration: ClickConfiguration,
+        min_delay: float = MIN_DELAY,
+        failsafe: bool = True,
+    ):
         """
         Initialize the engine with a configuration.
         
         DIP: Depends on abstraction (ClickConfiguration) not concrete details.
+        ``min_delay`` is the floor applied to the configured inter-click delay
+        (never below the platform timer resolution, TIMER_RESOLUTION).
+        ``failsafe`` stops clicking when the cursor is moved into a screen corner.
         """
         self._config = configuration
+        self._min_delay = max(TIMER_RESOLUTION, min_delay)
+        self._failsafe = failsafe
+        self._failsafe_tripped = False
+        self._ticker: Optional[Ticker] = None
         self._state = ClickerState.STOPPED
         self._worker_thread: Optional[threading.Thread] = None
         self._stop_flag = threading.Event()
         self._clicks_executed = 0
         self._status_callback: Optional[Callable[[str], None]] = None
+        self._click_callback: Optional[Callable[[int], None]] = None
+        self._clicker: Optional[NativeClicker] = None
         
-        # Configure pyautogui for safety
-    pyautogui.FAILSAFE = True  # Move mouse to corner to stop
-    pyautogui.PAUSE = 0.0  # Allow CPS above 100 without artificial delay
-    
+
     def register_status_callback(self, callback: Callable[[str], None]) -> None:
         """
-        Register a callback for status updates.
+        Register a callback for status updates (start, completion, errors;
+        running click counts go to the click callback).
         
         OCP: Open for extension (can add callbacks) without modifying core logic.
         """
         self._status_callback = callback
+
+    def register_click_callback(self, callback: Callable[[int], None]) -> None:
+        """
+        Register a callback receiving the executed click count.
+
+        Called from the worker thread at most every STATUS_INTERVAL while
+        running, and once more after the run has ended (state already final).
+        """
+        self._click_callback = callback
     
     def start(self) -> bool:
         """
@@ -106,76 +156,296 @@ class AutoClickerEngine:
         called internally. Keeps implementation details hidden.
         """
         try:
-            delay = self._config.get_delay_between_clicks()
+            self._execute_run()
+        finally:
+            # Final count; the state is already updated so listeners can tell the run ended
+            if self._click_callback:
+                self._click_callback(self._clicks_executed)
 
-            if self._config.click_mode == ClickMode.FOLLOW_CURSOR:
-                self._run_follow_cursor_loop(delay)
-            else:
-                self._run_static_sequence_loop(delay)
+    def _execute_run(self) -> None:
+        """Prepare the run, execute the selected loop and record the outcome."""
+        watchdog_done = threading.Event()
+        try:
+            run = self._prepare_run(watchdog_done)
+        except Exception as e:
+            self._state = ClickerState.ERROR
+            self._notify_status(f"Error: {str(e)}")
+            self._release_run_resources(watchdog_done)
+            return
+
+        # The loops run outside the setup guard: only OS-level click failures
+        # are expected here, anything else is a bug and must surface.
+        try:
+            run()
+        except OSError as e:
+            self._state = ClickerState.ERROR
+            self._notify_status(f"Click failed: {e}. Total clicks: {self._clicks_executed}")
+            return
+        except BaseException:
+            self._state = ClickerState.ERROR
+            raise
+        finally:
+            self._release_run_resources(watchdog_done)
 
+        if self._failsafe_tripped:
+            self._state = ClickerState.ERROR
+            self._notify_status(
+                f"Fail-safe triggered (cursor in screen corner). Total clicks: {self._clicks_executed}"
+            )
+        else:
             self._state = ClickerState.STOPPED
             self._notify_status(f"Completed. Total clicks: {self._clicks_executed}")
 
-        except Exception as e:
-            self._state = ClickerState.ERROR
-            self._notify_status(f"Error: {str(e)}")
+    def _prepare_run(self, watchdog_done: threading.Event) -> Callable[[], None]:
+        """Set up clicker, watchdog and ticker; return the loop to execute."""
+        self._clicker = NativeClicker()
+        self._failsafe_tripped = False
+        if self._failsafe:
+            threading.Thread(target=self._failsafe_watchdog, args=(watchdog_done,), daemon=True).start()
+        # Snapshot the configuration once; the loops below only touch locals
+        delay = max(self._config.get_delay_between_clicks(), self._min_delay)
+        infinite = self._config.is_infinite_mode()
+        total = self._config.total_clicks
+
+        # Less scheduler jitter; every run sleeps between clicks (delay >= MIN_DELAY),
+        # so a time-critical thread cannot starve the desktop
+        if not raise_thread_priority() and sys.platform.startswith("win"):
+            self._notify_status("Could not raise click thread priority; timing may jitter")
+
+        positions = self._config.click_positions
+        follow_cursor = self._config.click_mode == ClickMode.FOLLOW_CURSOR
+        if self._can_burst(delay, follow_cursor, len(positions)):
+            # Single fixed target at a very high rate: several clicks per syscall
+            if follow_cursor:
+                single_fn = self._select_click_callable(at_position=False)
+                burst_fn = self._select_click_callable(at_position=False, repeat=BURST_CLICKS)
+            else:
+                x, y = positions[0].x, positions[0].y
+                click_at = self._select_click_callable(at_position=True)
+                burst_at = self._select_click_callable(at_position=True, repeat=BURST_CLICKS)
+                single_fn = partial(click_at, x, y)
+                burst_fn = partial(burst_at, x, y)
+            # Whole bursts are paced by the kernel timer: a coarse sleep would
+            # round every few-millisecond burst period up to the scheduler tick.
+            self._ticker = self._make_run_ticker(delay * BURST_CLICKS)
+            return partial(self._run_burst_loop, delay, single_fn, burst_fn, BURST_CLICKS, infinite, total)
+        if follow_cursor:
+            self._ticker = self._make_run_ticker(delay)
+            click_fn = self._select_click_callable(at_position=False)
+            return partial(self._run_follow_cursor_loop, delay, click_fn, infinite, total)
+        # Plain (x, y) int pairs instead of ClickPosition objects, built once per run
+        targets = tuple((p.x, p.y) for p in positions)
+        self._ticker = self._make_run_ticker(delay)
+        click_fn = self._select_click_callable(at_position=True)
+        return partial(self._run_static_sequence_loop, delay, click_fn, targets, infinite, total)
+
+    def _release_run_resources(self, watchdog_done: threading.Event) -> None:
+        """Stop the watchdog and close the ticker and clicker of a run."""
+        watchdog_done.set()
+        if self._ticker is not None:
+            self._ticker.close()
+            self._ticker = None
+        if self._clicker is not None:
+            self._clicker.close()
+            self._clicker = None
     
-    def _run_static_sequence_loop(self, delay: float) -> None:
+    def _run_static_sequence_loop(
+        self,
+        delay: float,
+        click_fn: Callable[[int, int], None],
+        targets: Tuple[Tuple[int, int], ...],
+        infinite: bool,
+        total: int,
+    ) -> None:
         """Execute clicking loop for static sequence mode."""
-        position_count = len(self._config.click_positions)
-        current_position_index = 0
+        wait_next = self._select_wait(delay)
+        executed = 0
+        perf_counter = time.perf_counter
+        next_tick = perf_counter()
+        notify_at = next_tick + STATUS_INTERVAL
 
-        while not self._stop_flag.is_set():
-            if not self._config.is_infinite_mode() and \
-               self._clicks_executed >= self._config.total_clicks:
-                break
+        # Target rotation and the click limit are driven by C-level iterators,
+        # leaving only the click, counter and pacing in interpreted code.
+        sequence = cycle(targets)
+        if not infinite:
+            sequence = islice(sequence, total)
 
-            position = self._config.click_positions[current_position_index]
-            self._perform_click(position)
+        for x, y in sequence:
+            click_fn(x, y)
 
-            self._clicks_executed += 1
-            current_position_index = (current_position_index + 1) % position_count
+            executed += 1
+            self._clicks_executed = executed
 
-            if self._clicks_executed % 10 == 0:
-                self._notify_status(f"Clicks executed: {self._clicks_executed}")
+            now = perf_counter()
+            if now >= notify_at:
+                notify_at = now + STATUS_INTERVAL
+                self._notify_progress(executed)
 
-            time.sleep(delay)
+            next_tick = wait_next(next_tick, delay)
+            if next_tick is None:
+                break
 
-    def _run_follow_cursor_loop(self, delay: float) -> None:
+    def _run_follow_cursor_loop(
+        self,
+        delay: float,
+        click_fn: Callable[[], None],
+        infinite: bool,
+        total: int,
+    ) -> None:
         """Execute clicking loop that follows the live cursor position."""
-        while not self._stop_flag.is_set():
-            if not self._config.is_infinite_mode() and \
-               self._clicks_executed >= self._config.total_clicks:
-                break
+        wait_next = self._select_wait(delay)
+        executed = 0
+        perf_counter = time.perf_counter
+        next_tick = perf_counter()
+        notify_at = next_tick + STATUS_INTERVAL
+
+        # A finite run counts down in a C-level range iterator; an infinite run
+        # has no limit test at all. Stopping is handled by wait_next either way.
+        for _ in (repeat(None) if infinite else range(total)):
+            click_fn()
+            executed += 1
+            self._clicks_executed = executed
+
+            now = perf_counter()
+            if now >= notify_at:
+                notify_at = now + STATUS_INTERVAL
+                self._notify_progress(executed)
 
-            self._perform_click(position=None)
-            self._clicks_executed += 1
+            next_tick = wait_next(next_tick, delay)
+            if next_tick is None:
+                break
 
-            if self._clicks_executed % 10 == 0:
-                self._notify_status(f"Clicks executed: {self._clicks_executed}")
+    def _can_burst(self, delay: float, follow_cursor: bool, pos_count: int) -> bool:
+        """Bursting only pays off (and is only batched) for SendInput at sub-millisecond delays."""
+        return (
+            delay < BURST_MAX_DELAY
+            and self._clicker.backend == "win32"
+            and (follow_cursor or pos_count == 1)
+        )
 
-            time.sleep(delay)
+    def _run_burst_loop(
+        self,
+        delay: float,
+        single_fn: Callable[[], None],
+        burst_fn: Callable[[], None],
+        burst: int,
+        infinite: bool,
+        total: int,
+    ) -> None:
+        """
+        Click ``burst`` times per call, pacing whole bursts; the tail of a finite run goes singly.
 
-    def _perform_click(self, position: Optional[ClickPosition]) -> None:
-        """Perform a click either at a fixed position or at the current cursor."""
-        button = 'left'
-        if self._config.click_type == ClickType.RIGHT:
-            button = 'right'
+        With a ticker every call (burst or tail click) waits one burst period.
+        """
+        burst_delay = delay * burst
+        wait_next = self._select_wait(burst_delay)
+        executed = 0
+        perf_counter = time.perf_counter
+        next_tick = perf_counter()
+        notify_at = next_tick + STATUS_INTERVAL
 
-        if self._config.click_type == ClickType.DOUBLE:
-            if position:
-                x, y = position.to_tuple()
-                pyautogui.doubleClick(x=x, y=y, button=button)
+        while True:
+            if infinite or total - executed >= burst:
+                burst_fn()
+                executed += burst
+                step = burst_delay
+            elif executed < total:
+                single_fn()
+                executed += 1
+                step = delay
             else:
-                pyautogui.doubleClick(button=button)
-            return
+                break
+            self._clicks_executed = executed
+
+            now = perf_counter()
+            if now >= notify_at:
+                notify_at = now + STATUS_INTERVAL
+                self._notify_progress(executed)
+
+            next_tick = wait_next(next_tick, step)
+            if next_tick is None:
+                break
+
+    @staticmethod
+    def _make_run_ticker(delay: float) -> Optional[Ticker]:
+        """Kernel timer for short delays, where sleep granularity would dominate."""
+        if 0 < delay <= TICKER_MAX_DELAY:
+            return make_ticker(delay)
+        return None
+
+    def _select_wait(self, delay: float) -> Callable[[float, float], Optional[float]]:
+        """Kernel ticks when a ticker is running, otherwise deadline pacing."""
+        ticker = self._ticker
+        if delay > 0 and ticker is not None:
+            stop_flag = self._stop_flag
+            tick = ticker.wait
+
+            def ticked(next_tick: float, _delay: float) -> Optional[float]:
+                tick()
+                return None if stop_flag.is_set() else next_tick
+            return ticked
+        return self._wait_until_next_tick
+
+    def _wait_until_next_tick(self, next_tick: float, delay: float) -> Optional[float]:
+        """
+        Sleep until the next absolute deadline and return it, or None once stop() was requested.
+
+        Deadlines advance by exactly ``delay`` so sleep jitter doesn't accumulate.
+        The stop flag's wait() is both the sleep and the stop check, so stop()
+        wakes the loop immediately.
+        """
+        next_tick += delay
+        remaining = next_tick - time.perf_counter()
+        if remaining > 0:
+            if self._stop_flag.wait(remaining):
+                return None
+        elif self._stop_flag.is_set():
+            return None
+        elif remaining < -delay:
+            # Fell more than a whole interval behind (e.g. system stall): resync
+            # instead of firing a burst of catch-up clicks.
+            next_tick = time.perf_counter()
+        return next_tick
+
+    def _select_click_callable(self, at_position: bool, repeat: int = 1) -> Callable[..., None]:
+        """
+        Build the click function for this run.
+
+        Button and single/double are fixed for the whole run, so one of the
+        four specialized backend callables (single/double x position/cursor)
+        is picked once here instead of branching on the configuration per click.
+        """
+        button = 'right' if self._config.click_type == ClickType.RIGHT else 'left'
+        double = self._config.click_type == ClickType.DOUBLE
+        if at_position:
+            return self._clicker.bind_click_at(button, double, repeat)
+        return self._clicker.bind_click_current(button, double, repeat)
+
+    def _failsafe_watchdog(self, done: threading.Event) -> None:
+        """
+        Stop clicking when the cursor reaches a screen corner.
+
+        Runs beside the click loop and samples the cursor at 20 Hz, so the
+        hot loop never pays for a position query. The reader is created on
+        this thread (its own X display), so it shares no connection with others.
+        """
+        corners = set(pyautogui.FAILSAFE_POINTS)
+        read_cursor = cursor_reader()
+        while not done.wait(FAILSAFE_POLL_INTERVAL):
+            if read_cursor() in corners:
+                self._failsafe_tripped = True
+                self._stop_flag.set()
+                return
+
+    def _notify_progress(self, executed: int) -> None:
+        """Push the running click count to the click callback.
+
+        Progress stays off the status callback, which callers log: only
+        start, final and error messages go there.
+        """
+        if self._click_callback:
+            self._click_callback(executed)
 
-        if position:
-            x, y = position.to_tuple()
-            pyautogui.click(x, y, button=button)
-        else:
-            pyautogui.click(button=button)
-    
     def _notify_status(self, message: str) -> None:
         """
         Notify registered callbacks about status changes.
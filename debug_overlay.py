@@ -3,19 +3,44 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Iterable, List
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
 
+from automation import win32
 from models import ClickPosition
 
+_MARKER_FONT = ("Arial", 12, "bold")
+# Colour keyed out by -transparentcolor; those pixels are invisible and click-through
+_TRANSPARENT_KEY = "#010101"
+
 
 class DebugOverlayManager:
-    """Manages small overlay windows to visualise click targets."""
+    """Manages overlay markers to visualise click targets.
+
+    On Windows all markers are items on one click-through, full-desktop
+    canvas window. Other platforms can't key out a colour (a full-screen
+    window would swallow clicks), so there each marker is a small Toplevel.
+    """
 
     def __init__(self, root: tk.Tk) -> None:
         self._root = root
         self._overlays: List[tk.Toplevel] = []
+        self._labels: List[tk.Label] = []
+        # (label text, geometry) currently shown by each overlay
+        self._rendered: List[Tuple[str, str]] = []
         self._enabled = False
-        self._positions: List[ClickPosition] = []
+        # Positions as parallel columns (x, y, label)
+        self._xs: Sequence[int] = array("i")
+        self._ys: Sequence[int] = array("i")
+        self._pos_labels: Sequence[Optional[str]] = ()
+
+        self._single_window = win32.IS_WINDOWS
+        self._canvas_window: Optional[tk.Toplevel] = None
+        self._canvas: Optional[tk.Canvas] = None
+        self._origin = (0, 0)
+        # (rectangle id, text id) per marker, plus what each currently shows
+        self._canvas_items: List[Tuple[int, int]] = []
+        self._canvas_rendered: List[Tuple[str, int, int]] = []
 
     def enable(self) -> None:
         """Display overlays for all known positions."""
@@ -31,7 +56,18 @@ class DebugOverlayManager:
 
     def set_positions(self, positions: Iterable[ClickPosition]) -> None:
         """Update overlay positions and refresh display when enabled."""
-        self._positions = list(positions)
+        positions = list(positions)
+        self.set_position_columns(
+            array("i", [p.x for p in positions]),
+            array("i", [p.y for p in positions]),
+            [p.label for p in positions],
+        )
+
+    def set_position_columns(
+        self, xs: Sequence[int], ys: Sequence[int], labels: Sequence[Optional[str]]
+    ) -> None:
+        """Like set_positions, for callers that already keep x/y/label columns."""
+        self._xs, self._ys, self._pos_labels = xs, ys, labels
         if self._enabled:
             self._rebuild_overlays()
 
@@ -43,35 +79,141 @@ class DebugOverlayManager:
             self.disable()
 
     def _rebuild_overlays(self) -> None:
-        self._clear()
+        """Sync markers with positions, reusing existing windows/items where possible."""
         if not self._enabled:
+            self._clear()
             return
 
-        for index, position in enumerate(self._positions, start=1):
-            overlay = tk.Toplevel(self._root)
-            overlay.overrideredirect(True)
-            overlay.attributes("-topmost", True)
-            overlay.attributes("-alpha", 0.65)
-            overlay.configure(bg="yellow")
-
-            marker_text = position.label or f"#{index}"
-            label = tk.Label(
-                overlay,
-                text=f"✕ {marker_text}",
-                font=("Arial", 12, "bold"),
-                fg="red",
-                bg="yellow",
-            )
-            label.pack(ipadx=4, ipady=2)
-
-            overlay.geometry(f"+{position.x}+{position.y}")
-            overlay.update_idletasks()
-            self._overlays.append(overlay)
+        if self._single_window:
+            try:
+                self._sync_canvas()
+                return
+            except tk.TclError:
+                # e.g. -transparentcolor unsupported: fall back to one window per marker
+                self._destroy_canvas()
+                self._single_window = False
 
-    def _clear(self) -> None:
-        while self._overlays:
-            window = self._overlays.pop()
+        wanted = [
+            (f"✕ {label or f'#{index}'}", f"+{x}+{y}")
+            for index, (x, y, label) in enumerate(zip(self._xs, self._ys, self._pos_labels), start=1)
+        ]
+
+        while len(self._overlays) > len(wanted):
+            self._destroy_last()
+
+        for index, (text, geometry) in enumerate(wanted):
+            if index < len(self._overlays):
+                old_text, old_geometry = self._rendered[index]
+                if text != old_text:
+                    self._labels[index].configure(text=text)
+                if geometry != old_geometry:
+                    self._overlays[index].geometry(geometry)
+                self._rendered[index] = (text, geometry)
+            else:
+                self._create_overlay(text, geometry)
+
+    # Single canvas window ---------------------------------------------
+
+    def _ensure_canvas(self) -> tk.Canvas:
+        if self._canvas is not None:
+            return self._canvas
+        rect = win32.virtual_screen_rect()
+        if rect is None:
+            rect = (0, 0, self._root.winfo_screenwidth(), self._root.winfo_screenheight())
+        left, top, width, height = rect
+
+        window = tk.Toplevel(self._root)
+        window.overrideredirect(True)
+        window.attributes("-topmost", True)
+        window.attributes("-alpha", 0.65)
+        window.configure(bg=_TRANSPARENT_KEY)
+        self._canvas_window = window
+        window.attributes("-transparentcolor", _TRANSPARENT_KEY)
+        window.geometry(f"{width}x{height}+{left}+{top}")
+
+        canvas = tk.Canvas(window, bg=_TRANSPARENT_KEY, highlightthickness=0, bd=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self._canvas = canvas
+        self._origin = (left, top)
+        return canvas
+
+    def _sync_canvas(self) -> None:
+        canvas = self._ensure_canvas()
+        left, top = self._origin
+        wanted = [
+            (f"✕ {label or f'#{index}'}", x - left, y - top)
+            for index, (x, y, label) in enumerate(zip(self._xs, self._ys, self._pos_labels), start=1)
+        ]
+
+        while len(self._canvas_items) > len(wanted):
+            rect_id, text_id = self._canvas_items.pop()
+            self._canvas_rendered.pop()
+            canvas.delete(rect_id, text_id)
+
+        for index, (text, x, y) in enumerate(wanted):
+            if index < len(self._canvas_items):
+                if self._canvas_rendered[index] == (text, x, y):
+                    continue
+                rect_id, text_id = self._canvas_items[index]
+                canvas.itemconfigure(text_id, text=text)
+                canvas.coords(text_id, x + 4, y + 2)
+            else:
+                text_id = canvas.create_text(x + 4, y + 2, anchor="nw", text=text, fill="red", font=_MARKER_FONT)
+                rect_id = canvas.create_rectangle(0, 0, 0, 0, fill="yellow", outline="")
+                canvas.tag_lower(rect_id, text_id)
+                self._canvas_items.append((rect_id, text_id))
+                self._canvas_rendered.append((text, x, y))
+            # Background box matches the old label's padding (ipadx=4, ipady=2)
+            x1, y1, x2, y2 = canvas.bbox(text_id)
+            canvas.coords(rect_id, x1 - 4, y1 - 2, x2 + 4, y2 + 2)
+            self._canvas_rendered[index] = (text, x, y)
+
+    def _destroy_canvas(self) -> None:
+        window = self._canvas_window
+        self._canvas_window = None
+        self._canvas = None
+        self._canvas_items.clear()
+        self._canvas_rendered.clear()
+        if window is not None:
             try:
                 window.destroy()
             except Exception:
                 pass
+
+    # One window per marker --------------------------------------------
+
+    def _create_overlay(self, text: str, geometry: str) -> None:
+        overlay = tk.Toplevel(self._root)
+        overlay.overrideredirect(True)
+        overlay.attributes("-topmost", True)
+        overlay.attributes("-alpha", 0.65)
+        overlay.configure(bg="yellow")
+
+        label = tk.Label(
+            overlay,
+            text=text,
+            font=_MARKER_FONT,
+            fg="red",
+            bg="yellow",
+        )
+        label.pack(ipadx=4, ipady=2)
+
+        overlay.geometry(geometry)
+        overlay.update_idletasks()
+        self._overlays.append(overlay)
+        self._labels.append(label)
+        self._rendered.append((text, geometry))
+
+    def _destroy_last(self) -> None:
+        window = self._overlays.pop()
+        self._labels.pop()
+        self._rendered.pop()
+        try:
+            window.destroy()
+        except Exception:
+            pass
+
+    def _clear(self) -> None:
+        self._destroy_canvas()
+        while self._overlays:
+            self._destroy_last()
@@ -14,14 +14,19 @@ from __future__ import annotations
 
 import time
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+import copy
 import json
-from typing import Optional, List, Dict, Any, Tuple
+import queue
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Deque, Set, Callable, Mapping
 import sys
 import os
+from dataclasses import dataclass, field
 import shutil
-
-import pyautogui
+import threading
+from array import array
 
 from models import (
     ApplicationSettings,
@@ -37,16 +42,293 @@ from click_capture import ClickCaptureService
 from debug_overlay import DebugOverlayManager
 from hotkey_manager import HotkeyManager
 from logger import StatusLogger
+from native_click import cursor_position, cursor_reader
 from settings_manager import SettingsManager
 
+# The Tk variables hold enum values; look the members up without Enum.__call__
+_CLICK_TYPE_VALUES = tuple(choice.value for choice in ClickType)
+_CLICK_TYPE_BY_VALUE = {choice.value: choice for choice in ClickType}
+_CLICK_MODE_BY_VALUE = {mode.value: mode for mode in ClickMode}
+
+
+# Texts of the interval and duration hints below the rate/total inputs
+_INTERVAL_HINT_FMT = "Intervall zwischen Klicks: {:.1f} ms"
+_INTERVAL_HINT_NONE = "Intervall zwischen Klicks: –"
+_DURATION_UNLIMITED = "Geschätzte Dauer: unbegrenzt (0 = unbegrenzt)"
+_DURATION_NONE = "Geschätzte Dauer: –"
+_DURATION_FMT_H = "Geschätzte Dauer: {}h {}m {}s"
+_DURATION_FMT_M = "Geschätzte Dauer: {}m {}s"
+_DURATION_FMT_S = "Geschätzte Dauer: {:.1f}s"
+
+
+# Theme colours; built once per process, read-only, shared by every _apply_theme call
+_DARK_PALETTE: Mapping[str, str] = MappingProxyType({
+    "app_bg": "#0f172a",
+    "card_bg": "#1f2937",
+    "header_bg": "#0b1628",
+    "accent_card_bg": "#1e293b",
+    "accent_outline": "#3b82f6",
+    "text_primary": "#f9fafb",
+    "text_secondary": "#d1d5db",
+    "text_muted": "#9ca3af",
+    "border_color": "#374151",
+    "accent_color": "#60a5fa",
+    "accent_hover": "#7dd3fc",
+    "accent_active": "#2563eb",
+    "accent_disabled": "#1d4ed8",
+    "text_on_accent": "#0b1628",
+    "text_on_disabled": "#bac8ff",
+    "danger_color": "#f87171",
+    "danger_hover": "#fb7185",
+    "danger_active": "#dc2626",
+    "danger_disabled": "#7f1d1d",
+    "ghost_bg": "#1f2937",
+    "ghost_hover": "#273548",
+    "ghost_active": "#324158",
+    "list_bg": "#111827",
+    "list_fg": "#f9fafb",
+    "text_area_bg": "#111827",
+    "entry_bg": "#111827",
+    "entry_fg": "#f9fafb",
+    "tab_unselected_fg": "#9ca3af",
+    "tab_selected_fg": "#f9fafb",
+    "separator": "#1f2937",
+    "highlight": "#3b82f6",
+})
+
+_LIGHT_PALETTE: Mapping[str, str] = MappingProxyType({
+    "app_bg": "#eef2f9",
+    "card_bg": "#ffffff",
+    "header_bg": "#f3f5f9",
+    "accent_card_bg": "#edf3ff",
+    "accent_outline": "#4e8cff",
+    "text_primary": "#1f2933",
+    "text_secondary": "#4b5563",
+    "text_muted": "#6b7280",
+    "border_color": "#d8dee9",
+    "accent_color": "#4e8cff",
+    "accent_hover": "#5f9dff",
+    "accent_active": "#2f6ed6",
+    "accent_disabled": "#99b9ff",
+    "text_on_accent": "#ffffff",
+    "text_on_disabled": "#cbd5f5",
+    "danger_color": "#d83b3b",
+    "danger_hover": "#e15656",
+    "danger_active": "#a72c2c",
+    "danger_disabled": "#f5b4b4",
+    "ghost_bg": "#eef2f9",
+    "ghost_hover": "#e2e8f5",
+    "ghost_active": "#cfd8ec",
+    "list_bg": "#ffffff",
+    "list_fg": "#1f2933",
+    "text_area_bg": "#ffffff",
+    "entry_bg": "#ffffff",
+    "entry_fg": "#1f2933",
+    "tab_unselected_fg": "#4b5563",
+    "tab_selected_fg": "#1f2933",
+    "separator": "#d8dee9",
+    "highlight": "#4e8cff",
+})
+
+
+# ttk style options per style name, as (option, palette key) pairs
+_STYLE_SPEC: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
+    ("TFrame", (("background", "card_bg"),)),
+    ("TLabel", (("background", "card_bg"), ("foreground", "text_primary"))),
+    ("TLabelFrame", (("background", "card_bg"), ("foreground", "text_primary"))),
+    ("TEntry", (("fieldbackground", "entry_bg"), ("foreground", "entry_fg"), ("background", "card_bg"))),
+    ("TCombobox", (("fieldbackground", "entry_bg"), ("foreground", "entry_fg"), ("background", "card_bg"))),
+    ("TCheckbutton", (("background", "card_bg"), ("foreground", "text_primary"))),
+    ("TButton", (("background", "card_bg"), ("foreground", "text_primary"))),
+    ("Background.TFrame", (("background", "app_bg"),)),
+    ("Card.TFrame", (("background", "card_bg"),)),
+    ("Header.TFrame", (("background", "header_bg"),)),
+    ("Header.TLabel", (("background", "header_bg"), ("foreground", "text_primary"))),
+    ("HeaderSubtitle.TLabel", (("background", "header_bg"), ("foreground", "text_secondary"))),
+    (
+        "Card.TLabelframe",
+        (
+            ("background", "card_bg"),
+            ("lightcolor", "border_color"),
+            ("darkcolor", "border_color"),
+            ("bordercolor", "border_color"),
+        ),
+    ),
+    ("Card.TLabelframe.Label", (("background", "card_bg"), ("foreground", "text_primary"))),
+    ("CardBody.TFrame", (("background", "card_bg"),)),
+    (
+        "AccentCard.TLabelframe",
+        (
+            ("background", "accent_card_bg"),
+            ("lightcolor", "accent_outline"),
+            ("darkcolor", "accent_outline"),
+            ("bordercolor", "accent_outline"),
+        ),
+    ),
+    ("AccentCard.TLabelframe.Label", (("background", "accent_card_bg"), ("foreground", "text_secondary"))),
+    ("AccentCard.TFrame", (("background", "accent_card_bg"),)),
+    ("AccentCardLabel.TLabel", (("background", "accent_card_bg"), ("foreground", "text_primary"))),
+    ("AccentCardHint.TLabel", (("background", "accent_card_bg"), ("foreground", "text_muted"))),
+    ("Secondary.TLabel", (("background", "card_bg"), ("foreground", "text_secondary"))),
+    ("Hint.TLabel", (("background", "card_bg"), ("foreground", "text_muted"))),
+    ("App.TNotebook", (("background", "app_bg"),)),
+    ("App.TNotebook.Tab", (("background", "app_bg"), ("foreground", "tab_unselected_fg"))),
+    ("Accent.TButton", (("background", "accent_color"), ("foreground", "text_on_accent"))),
+    ("Danger.TButton", (("background", "danger_color"), ("foreground", "text_on_accent"))),
+    ("Ghost.TButton", (("background", "ghost_bg"), ("foreground", "text_primary"))),
+    (
+        "AccentCard.TSpinbox",
+        (("fieldbackground", "entry_bg"), ("background", "entry_bg"), ("foreground", "entry_fg")),
+    ),
+    (
+        "AccentCard.TCombobox",
+        (("fieldbackground", "entry_bg"), ("background", "entry_bg"), ("foreground", "entry_fg")),
+    ),
+)
+
+# ttk state maps per style name, as (option, ((state, palette key), ...)) pairs
+_STYLE_MAP_SPEC: Tuple[Tuple[str, Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]], ...] = (
+    (
+        "App.TNotebook.Tab",
+        (
+            ("background", (("selected", "card_bg"), ("!selected", "app_bg"))),
+            ("foreground", (("selected", "tab_selected_fg"), ("!selected", "tab_unselected_fg"))),
+        ),
+    ),
+    (
+        "Accent.TButton",
+        (
+            ("background", (("disabled", "accent_disabled"), ("pressed", "accent_active"), ("active", "accent_hover"))),
+            ("foreground", (("disabled", "text_on_disabled"),)),
+        ),
+    ),
+    (
+        "Danger.TButton",
+        (
+            ("background", (("disabled", "danger_disabled"), ("pressed", "danger_active"), ("active", "danger_hover"))),
+            ("foreground", (("disabled", "text_on_disabled"),)),
+        ),
+    ),
+    ("Ghost.TButton", (("background", (("pressed", "ghost_active"), ("active", "ghost_hover"))),)),
+    (
+        "AccentCard.TSpinbox",
+        (
+            ("fieldbackground", (("disabled", "entry_bg"), ("readonly", "entry_bg"))),
+            ("foreground", (("disabled", "text_muted"),)),
+            ("arrowcolor", (("active", "accent_hover"), ("!active", "accent_color"))),
+        ),
+    ),
+    (
+        "AccentCard.TCombobox",
+        (
+            ("fieldbackground", (("readonly", "entry_bg"), ("disabled", "entry_bg"))),
+            ("foreground", (("disabled", "text_muted"),)),
+        ),
+    ),
+)
+
+# _STYLE_SPEC and _STYLE_MAP_SPEC with palette keys replaced by colours
+_ResolvedTheme = Tuple[List[Tuple[str, Dict[str, str]]], List[Tuple[str, Dict[str, Any]]]]
+
+
+@dataclass(slots=True, frozen=True)
+class EngineBinding:
+    """Tk variables and texts of one clicker engine slot (manual or automation)."""
+
+    engine_attr: str
+    status_var: tk.StringVar
+    click_var: tk.StringVar
+    cps_var: tk.StringVar
+    click_prefix: str
+    cps_prefix: str
+    status_running_text: str
+    status_ready_text: str
+    # Label templates, bound once; painting only fills in the numbers
+    click_fmt: Callable[[int], str] = field(init=False)
+    cps_fmt: Callable[[float], str] = field(init=False)
+    click_reset_text: str = field(init=False)
+    cps_reset_text: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        click_fmt = (self.click_prefix + ": {}").format
+        cps_fmt = (self.cps_prefix + ": {:.2f}").format
+        object.__setattr__(self, "click_fmt", click_fmt)
+        object.__setattr__(self, "cps_fmt", cps_fmt)
+        object.__setattr__(self, "click_reset_text", click_fmt(0))
+        object.__setattr__(self, "cps_reset_text", cps_fmt(0.0))
+
+
+class _CpsTracker:
+    """Fixed ring of (time, clicks) samples for the clicks-per-second label."""
+
+    __slots__ = ("_times", "_clicks", "_head", "_size")
+
+    CAPACITY = 16
+
+    def __init__(self, now: float, clicks: int) -> None:
+        self._times = array("d", bytes(8 * self.CAPACITY))
+        self._clicks = array("q", bytes(8 * self.CAPACITY))
+        self._head = 0
+        self._size = 1
+        self._times[0] = now
+        self._clicks[0] = clicks
+
+    @property
+    def last_clicks(self) -> int:
+        return self._clicks[self._head]
+
+    def push(self, now: float, clicks: int) -> None:
+        head = self._head + 1
+        if head == self.CAPACITY:
+            head = 0
+        self._head = head
+        self._times[head] = now
+        self._clicks[head] = clicks
+        if self._size < self.CAPACITY:
+            self._size += 1
+
+    def rate(self, now: float, window: float) -> float:
+        """Clicks per second since the oldest sample inside ``window`` (at least the previous one)."""
+        if self._size < 2:
+            return 0.0
+        times = self._times
+        head = self._head
+        capacity = self.CAPACITY
+        # Walk back from the sample before the newest while samples are in the window
+        oldest = head - 1 if head else capacity - 1
+        for _ in range(self._size - 2):
+            prev = oldest - 1 if oldest else capacity - 1
+            if now - times[prev] > window:
+                break
+            oldest = prev
+        elapsed = now - times[oldest]
+        return (self._clicks[head] - self._clicks[oldest]) / elapsed if elapsed > 0 else 0.0
+
 
 class AutoClickerGUI:
     """Tkinter based GUI that orchestrates all application services."""
 
     MONITOR_POLL_MS = 400
-    CLICK_COUNTER_POLL_MS = 120
+    # Monitor poll interval range: fast while the cursor moves, backing off
+    # by MONITOR_POLL_BACKOFF per idle tick up to the maximum
+    MONITOR_POLL_MIN_MS = 50
+    MONITOR_POLL_MAX_MS = 500
+    MONITOR_POLL_BACKOFF = 1.5
+    MONITOR_CACHE_SECONDS = 5.0
+    CURSOR_SAMPLE_INTERVAL = 0.05
+    PERSIST_DEBOUNCE_MS = 500
+    METRICS_DEBOUNCE_MS = 150
+    LOG_MAX_LINES = 500
+    LOG_FLUSH_MS = 50
+    ENGINE_QUEUE_POLL_MS = 50
+    ENGINE_QUEUE_BATCH = 200
+    CLICK_UI_MIN_INTERVAL = 0.05
+    CPS_WINDOW = 1.0
     DEFAULT_WINDOW_SIZE = (1150, 1000)
     MIN_WINDOW_SIZE = (960, 760)
+    _EXPORT_FILETYPES = (("Textdateien", "*.txt"), ("Alle Dateien", "*.*"))
+    _SCRIPT_OPEN_FILETYPES = (("JSON", "*.json"), ("Alle Dateien", "*.*"))
+    _SCRIPT_SAVE_FILETYPES = (("JSON", "*.json"),)
     WINDOW_MARGIN = (48, 80)
 
     def __init__(self, root: tk.Tk):
@@ -58,12 +340,22 @@ class AutoClickerGUI:
         self.settings: ApplicationSettings = self.settings_manager.load()
 
         self.style = ttk.Style()
-        self.dark_mode_var = tk.BooleanVar(value=getattr(self.settings, "dark_mode_enabled", False))
+        # Style tables resolved against each palette, see _resolve_theme
+        self._resolved_themes: Dict[bool, _ResolvedTheme] = {}
+        # Palette currently applied to the styles (None until the first _apply_theme)
+        self._applied_palette_is_dark: Optional[bool] = None
+        self.dark_mode_var = tk.BooleanVar(value=self.settings.dark_mode_enabled)
         self._configure_styles()
-        self._apply_theme()
 
         # Runtime state --------------------------------------------------
         self.click_positions: List[ClickPosition] = list(self.settings.click_positions)
+        # Immutable snapshot handed to engines; rebuilt only after a mutation
+        self._positions_snapshot: Optional[Tuple[ClickPosition, ...]] = None
+        # Column copies of click_positions for the listbox and the overlay
+        self._pos_xs = array("i")
+        self._pos_ys = array("i")
+        self._pos_labels: List[Optional[str]] = []
+        self._sync_position_columns()
         self.engine: Optional[AutoClickerEngine] = None
         self.automation_engine: Optional[AutoClickerEngine] = None
         self.script_engine: Optional[AutomationEngine] = None
@@ -72,20 +364,61 @@ class AutoClickerGUI:
             start_hotkey=self.settings.start_hotkey, stop_hotkey=self.settings.stop_hotkey
         )
         self.debug_overlay = DebugOverlayManager(root)
-        self.capture_service = ClickCaptureService(root)
+        # Capture results arrive on the pynput thread; hand them over through the engine queue
+        self.capture_service = ClickCaptureService(
+            root, dispatch=lambda fn, *args: self._engine_queue.put((fn, args))
+        )
 
         self._persist_suspended = True
-        self.manual_update_job: Optional[str] = None
-        self.automation_update_job: Optional[str] = None
+        self._pending_persist_job: Optional[str] = None
+        # Settings snapshots are written by one worker thread; the queue holds
+        # at most the newest pending snapshot (None stops the worker)
+        self._persist_queue: "queue.Queue[Optional[ApplicationSettings]]" = queue.Queue(maxsize=1)
+        self._persist_thread = threading.Thread(target=self._persist_worker, daemon=True)
+        self._persist_thread.start()
         self.monitor_job: Optional[str] = None
         self.capture_in_progress = False
-        self._cps_tracker: Dict[str, Dict[str, float]] = {}
+        # Latest cursor position, written by the sampling thread only
+        self._cursor_xy: Optional[Tuple[int, int]] = None
+        self._cursor_stop = threading.Event()
+        # Set while the main window is mapped; cursor sampling, the monitor
+        # poll and log widget writes pause while it is minimized or withdrawn
+        self._ui_visible = threading.Event()
+        self._ui_visible.set()
+        self._log_widget_pending: Deque[str] = deque(maxlen=self.LOG_MAX_LINES)
+        # Last LOG_MAX_LINES messages as shown in the log view; copied without reading the widget
+        self._log_tail: Deque[str] = deque(maxlen=self.LOG_MAX_LINES)
+        # Monitor layout, re-queried at most every MONITOR_CACHE_SECONDS
+        self._monitors_cache: List[Dict[str, int]] = []
+        self._monitors_cached_at = float("-inf")
+        # Rows currently shown in position_listbox
+        self._listbox_cache: List[str] = []
+        # (message, level) pairs waiting for the next _flush_log
+        self._log_buffer: Deque[Tuple[str, str]] = deque()
+        self._log_flush_pending = False
+        # Worker threads never touch Tk: they post (handler, args) here and the
+        # Tk thread runs them from _drain_engine_queue
+        self._engine_queue: "queue.SimpleQueue[Tuple[Callable[..., None], Tuple[Any, ...]]]" = queue.SimpleQueue()
+        self._engine_queue_job: Optional[str] = None
+        # Per engine: (time, clicks) samples spanning about CPS_WINDOW seconds
+        self._cps_tracker: Dict[str, _CpsTracker] = {}
+        # Last text written per engine StringVar, see _flush_ui
+        self._last_ui_strings: Dict[Tuple[str, str], str] = {}
+        # Click counts pushed by the engines, drained on the Tk thread
+        self._click_events: Dict[str, Deque[Tuple[int, float]]] = {}
+        self._click_drain_pending: Set[str] = set()
+        self._last_click_paint: Dict[str, float] = {}
 
         # Tk variables ---------------------------------------------------
         self.click_mode_var = tk.StringVar(value=self.settings.click_mode.value)
         self.click_rate_var = tk.DoubleVar(value=self.settings.click_rate_per_second)
         self.total_clicks_var = tk.IntVar(value=self.settings.total_clicks)
         self.click_type_var = tk.StringVar(value=self.settings.click_type.value)
+        # Enum members of the two variables, refreshed by write traces
+        self._cached_click_mode: ClickMode = self.settings.click_mode
+        self._cached_click_type: ClickType = self.settings.click_type
+        self.click_mode_var.trace_add("write", self._update_cached_click_mode)
+        self.click_type_var.trace_add("write", self._update_cached_click_type)
         self.background_var = tk.BooleanVar(value=self.settings.run_in_background)
         self.debug_overlay_var = tk.BooleanVar(value=self.settings.debug_overlay_enabled)
         self.start_hotkey_var = tk.StringVar(value=self.settings.start_hotkey)
@@ -98,27 +431,30 @@ class AutoClickerGUI:
         self.manual_cps_var = tk.StringVar(value="Aktuelle CPS: 0.00")
         self.automation_cps_var = tk.StringVar(value="CPS (Automatisierung): 0.00")
         self.script_status_var = tk.StringVar(value="Script: Bereit")
+        self._manual_binding = EngineBinding(
+            engine_attr="engine",
+            status_var=self.status_var,
+            click_var=self.click_count_var,
+            cps_var=self.manual_cps_var,
+            click_prefix="Ausgeführte Klicks",
+            cps_prefix="Aktuelle CPS",
+            status_running_text="Status: Läuft",
+            status_ready_text="Status: Bereit",
+        )
+        self._automation_binding = EngineBinding(
+            engine_attr="automation_engine",
+            status_var=self.automation_status_var,
+            click_var=self.automation_clicks_var,
+            cps_var=self.automation_cps_var,
+            click_prefix="Klicks (Automatisierung)",
+            cps_prefix="CPS (Automatisierung)",
+            status_running_text="Automatisierung: Läuft",
+            status_ready_text="Automatisierung: Bereit",
+        )
         # Script-Builder (no-code) state
         self.script_actions: List[Dict[str, Any]] = []
-        self.builder_action_type = tk.StringVar(value="type_text")
-        self.builder_text_var = tk.StringVar(value="Hello from Script!")
-        self.builder_sequence_var = tk.StringVar(value="<ENTER>")
-        self.builder_wait_ms_var = tk.IntVar(value=300)
-        self.builder_command_var = tk.StringVar(value="notepad.exe")
-        self.builder_args_var = tk.StringVar(value="")
-        self.builder_title_var = tk.StringVar(value="")
-        self.builder_template_var = tk.StringVar(value="Vorlage wählen…")
-        # Mouse/Scroll builder vars
-        self.builder_click_x_var = tk.StringVar(value="")  # allow blank for current cursor
-        self.builder_click_y_var = tk.StringVar(value="")
-        self.builder_click_button_var = tk.StringVar(value="left")
-        self.builder_click_count_var = tk.IntVar(value=1)
-        self.builder_scroll_amount_var = tk.IntVar(value=300)
-        self.builder_scroll_horizontal_var = tk.BooleanVar(value=False)
-        self.builder_autosync_var = tk.BooleanVar(value=True)
-        # Loop builder vars
-        self.builder_repeat_count_var = tk.IntVar(value=1)
-        self.builder_until_stopped_var = tk.BooleanVar(value=False)
+        # Builder Tk variables are created on first use, see _ensure_builder_vars
+        self._builder_vars_ready = False
         # Builder window/widget placeholders (created on demand)
         self._builder_win = None
         self._fld_text = None
@@ -135,26 +471,32 @@ class AutoClickerGUI:
         self.position_count_var = tk.StringVar(value="")
         self.click_interval_hint_var = tk.StringVar(value="")
         self.estimated_duration_var = tk.StringVar(value="")
+        # Widget states driven by the click mode, see _on_click_mode_changed
+        self._last_mode_state: Optional[str] = None
+        self._mode_state_scripts: Dict[str, str] = {}
+        # Reused "add position" dialog, created on first use
+        self._custom_pos_dialog: Optional[tk.Toplevel] = None
+        self._custom_pos_vars: Optional[Tuple[tk.StringVar, tk.StringVar, tk.StringVar, tk.StringVar]] = None
         # Builder capture state
         self._builder_capture_in_progress = False
 
-        # Autosync traces for loop fields
-        try:
-            self.builder_repeat_count_var.trace_add("write", lambda *_: self._builder_maybe_autosync())
-            self.builder_until_stopped_var.trace_add("write", lambda *_: self._builder_maybe_autosync())
-        except Exception:
-            pass
-
-        self.click_rate_var.trace_add("write", lambda *_: self._update_click_metrics())
-        self.total_clicks_var.trace_add("write", lambda *_: self._update_click_metrics())
-        self._update_click_metrics()
+        # Numeric inputs are validated on every edit; Start and the settings
+        # writer use the cached values (None while the field is invalid)
+        self._validated_rate: Optional[float] = None
+        self._validated_total: Optional[int] = None
+        # Interval/duration hints are repainted once per typing burst
+        self._metrics_inputs: Tuple[float, int] = (0.0, 0)
+        self._metrics_after_id: Optional[str] = None
+        # Hint texts last written, so unchanged values skip the Tk variable
+        self._last_interval_hint = ""
+        self._last_duration_str = ""
 
         # UI --------------------------------------------------------------
         self._build_ui()
         self._apply_theme()
         self._refresh_position_list()
         self._on_click_mode_changed()
-        self.debug_overlay.set_positions(self.click_positions)
+        self.debug_overlay.set_position_columns(self._pos_xs, self._pos_ys, self._pos_labels)
         self.debug_overlay.toggle(self.debug_overlay_var.get())
 
         # Platform-specific hints (Linux/Wayland, missing tools)
@@ -162,37 +504,60 @@ class AutoClickerGUI:
 
         # Services -------------------------------------------------------
         self._setup_hotkeys()
+        threading.Thread(target=self._sample_cursor_loop, daemon=True).start()
+        self._engine_queue_job = self.root.after(self.ENGINE_QUEUE_POLL_MS, self._drain_engine_queue)
         self._start_monitor_updates()
 
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
+
+        # Watch the numeric inputs only once the widgets exist; one explicit
+        # pass seeds the validated values and the hint labels
+        self.click_rate_var.trace_add("write", self._on_numeric_changed)
+        self.total_clicks_var.trace_add("write", self._on_numeric_changed)
+        self._on_numeric_changed()
+
         self._persist_suspended = False
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
     def _configure_window_geometry(self) -> None:
         """Adapt the main window to the active monitor resolution."""
         # Try to use virtual screen across all monitors if available
-        screen_bounds = self._get_virtual_screen_bounds()
-        screen_width = max(int(screen_bounds[2]), 1)
-        screen_height = max(int(screen_bounds[3]), 1)
+        left, top, screen_width, screen_height = self._get_virtual_screen_bounds()
+        if screen_width < 1:
+            screen_width = 1
+        if screen_height < 1:
+            screen_height = 1
         margin_x, margin_y = self.WINDOW_MARGIN
 
-        usable_width = max(screen_width - margin_x, 720)
-        usable_height = max(screen_height - margin_y, 640)
+        usable_width = screen_width - margin_x
+        if usable_width < 720:
+            usable_width = 720
+        usable_height = screen_height - margin_y
+        if usable_height < 640:
+            usable_height = 640
 
         default_width, default_height = self.DEFAULT_WINDOW_SIZE
         min_width, min_height = self.MIN_WINDOW_SIZE
 
-        width = min(default_width, usable_width)
-        height = min(default_height, usable_height)
+        # Default size, shrunk to the usable area but not below the minimum size
+        # (unless the screen itself is smaller)
+        width = default_width if default_width < usable_width else usable_width
+        if width < min_width:
+            width = min_width if min_width < usable_width else usable_width
+        height = default_height if default_height < usable_height else usable_height
+        if height < min_height:
+            height = min_height if min_height < usable_height else usable_height
 
-        width = max(width, min(min_width, usable_width))
-        height = max(height, min(min_height, usable_height))
+        # Centered, never left of / above the virtual screen origin
+        offset_x = (screen_width - width) // 2
+        offset_y = (screen_height - height) // 2
+        x = left + offset_x if offset_x > 0 else left
+        y = top + offset_y if offset_y > 0 else top
 
-        x = max((screen_width - width) // 2 + int(screen_bounds[0]), int(screen_bounds[0]))
-        y = max((screen_height - height) // 2 + int(screen_bounds[1]), int(screen_bounds[1]))
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
 
-        self.root.geometry(f"{int(width)}x{int(height)}+{int(x)}+{int(y)}")
-
-        self.root.minsize(int(width), int(height))
+        self.root.minsize(width, height)
 
         allow_resize = width < default_width or height < default_height
         self.root.resizable(allow_resize, allow_resize)
@@ -249,211 +614,68 @@ class AutoClickerGUI:
         self.style.configure("Secondary.TLabel")
         self.style.configure("Hint.TLabel")
 
-        self._apply_theme(initial=True)
-
-    def _get_palette(self, dark: bool) -> Dict[str, str]:
-        if dark:
-            return {
-                "app_bg": "#0f172a",
-                "card_bg": "#1f2937",
-                "header_bg": "#0b1628",
-                "accent_card_bg": "#1e293b",
-                "accent_outline": "#3b82f6",
-                "text_primary": "#f9fafb",
-                "text_secondary": "#d1d5db",
-                "text_muted": "#9ca3af",
-                "border_color": "#374151",
-                "accent_color": "#60a5fa",
-                "accent_hover": "#7dd3fc",
-                "accent_active": "#2563eb",
-                "accent_disabled": "#1d4ed8",
-                "text_on_accent": "#0b1628",
-                "text_on_disabled": "#bac8ff",
-                "danger_color": "#f87171",
-                "danger_hover": "#fb7185",
-                "danger_active": "#dc2626",
-                "danger_disabled": "#7f1d1d",
-                "ghost_bg": "#1f2937",
-                "ghost_hover": "#273548",
-                "ghost_active": "#324158",
-                "list_bg": "#111827",
-                "list_fg": "#f9fafb",
-                "text_area_bg": "#111827",
-                "entry_bg": "#111827",
-                "entry_fg": "#f9fafb",
-                "tab_unselected_fg": "#9ca3af",
-                "tab_selected_fg": "#f9fafb",
-                "separator": "#1f2937",
-                "highlight": "#3b82f6",
-            }
-        return {
-            "app_bg": "#eef2f9",
-            "card_bg": "#ffffff",
-            "header_bg": "#f3f5f9",
-            "accent_card_bg": "#edf3ff",
-            "accent_outline": "#4e8cff",
-            "text_primary": "#1f2933",
-            "text_secondary": "#4b5563",
-            "text_muted": "#6b7280",
-            "border_color": "#d8dee9",
-            "accent_color": "#4e8cff",
-            "accent_hover": "#5f9dff",
-            "accent_active": "#2f6ed6",
-            "accent_disabled": "#99b9ff",
-            "text_on_accent": "#ffffff",
-            "text_on_disabled": "#cbd5f5",
-            "danger_color": "#d83b3b",
-            "danger_hover": "#e15656",
-            "danger_active": "#a72c2c",
-            "danger_disabled": "#f5b4b4",
-            "ghost_bg": "#eef2f9",
-            "ghost_hover": "#e2e8f5",
-            "ghost_active": "#cfd8ec",
-            "list_bg": "#ffffff",
-            "list_fg": "#1f2933",
-            "text_area_bg": "#ffffff",
-            "entry_bg": "#ffffff",
-            "entry_fg": "#1f2933",
-            "tab_unselected_fg": "#4b5563",
-            "tab_selected_fg": "#1f2933",
-            "separator": "#d8dee9",
-            "highlight": "#4e8cff",
-        }
-
-    def _apply_theme(self, *, initial: bool = False) -> None:
-        palette = self._get_palette(self.dark_mode_var.get())
+    def _get_palette(self, dark: bool) -> Mapping[str, str]:
+        return _DARK_PALETTE if dark else _LIGHT_PALETTE
+
+    def _resolve_theme(self, dark: bool) -> _ResolvedTheme:
+        """Return the style tables filled in with the colours of one palette, built once per palette."""
+        resolved = self._resolved_themes.get(dark)
+        if resolved is None:
+            palette = self._get_palette(dark)
+            configures = [
+                (style_name, {option: palette[key] for option, key in options}) for style_name, options in _STYLE_SPEC
+            ]
+            maps = [
+                (
+                    style_name,
+                    {option: [(state, palette[key]) for state, key in states] for option, states in options},
+                )
+                for style_name, options in _STYLE_MAP_SPEC
+            ]
+            resolved = self._resolved_themes[dark] = (configures, maps)
+        return resolved
+
+    def _apply_theme(self) -> None:
+        dark = self.dark_mode_var.get()
+        if dark == self._applied_palette_is_dark:
+            return
+        palette = self._get_palette(dark)
         self._current_palette = palette
+        # Plain Tk widgets are not styled by ttk; their options are set directly
+        self._listbox_cfg = {
+            "bg": palette["list_bg"],
+            "fg": palette["list_fg"],
+            "selectbackground": palette["accent_color"],
+            "selectforeground": palette["text_on_accent"],
+            "highlightbackground": palette["border_color"],
+            "highlightcolor": palette["highlight"],
+            "relief": tk.FLAT,
+        }
+        self._log_text_cfg = {
+            "background": palette["text_area_bg"],
+            "foreground": palette["text_primary"],
+            "insertbackground": palette["text_primary"],
+        }
 
         self.root.configure(background=palette["app_bg"])
 
-        self.style.configure("TFrame", background=palette["card_bg"])
-        self.style.configure("TLabel", background=palette["card_bg"], foreground=palette["text_primary"])
-        self.style.configure("TLabelFrame", background=palette["card_bg"], foreground=palette["text_primary"])
-        self.style.configure("TEntry", fieldbackground=palette["entry_bg"], foreground=palette["entry_fg"], background=palette["card_bg"])
-        self.style.configure("TCombobox", fieldbackground=palette["entry_bg"], foreground=palette["entry_fg"], background=palette["card_bg"])
-        self.style.configure("TCheckbutton", background=palette["card_bg"], foreground=palette["text_primary"])
-        self.style.configure("TButton", background=palette["card_bg"], foreground=palette["text_primary"])
-
-        self.style.configure("Background.TFrame", background=palette["app_bg"])
-        self.style.configure("Card.TFrame", background=palette["card_bg"])
-        self.style.configure("Header.TFrame", background=palette["header_bg"])
-        self.style.configure("Header.TLabel", background=palette["header_bg"], foreground=palette["text_primary"])
-        self.style.configure("HeaderSubtitle.TLabel", background=palette["header_bg"], foreground=palette["text_secondary"])
-
-        self.style.configure(
-            "Card.TLabelframe",
-            background=palette["card_bg"],
-            lightcolor=palette["border_color"],
-            darkcolor=palette["border_color"],
-            bordercolor=palette["border_color"],
-        )
-        self.style.configure("Card.TLabelframe.Label", background=palette["card_bg"], foreground=palette["text_primary"])
-        self.style.configure("CardBody.TFrame", background=palette["card_bg"])
-
-        self.style.configure(
-            "AccentCard.TLabelframe",
-            background=palette["accent_card_bg"],
-            lightcolor=palette["accent_outline"],
-            darkcolor=palette["accent_outline"],
-            bordercolor=palette["accent_outline"],
-        )
-        self.style.configure("AccentCard.TLabelframe.Label", background=palette["accent_card_bg"], foreground=palette["text_secondary"])
-        self.style.configure("AccentCard.TFrame", background=palette["accent_card_bg"])
-        self.style.configure("AccentCardLabel.TLabel", background=palette["accent_card_bg"], foreground=palette["text_primary"])
-        self.style.configure("AccentCardHint.TLabel", background=palette["accent_card_bg"], foreground=palette["text_muted"])
-
-        self.style.configure("Secondary.TLabel", background=palette["card_bg"], foreground=palette["text_secondary"])
-        self.style.configure("Hint.TLabel", background=palette["card_bg"], foreground=palette["text_muted"])
-
-        self.style.configure("App.TNotebook", background=palette["app_bg"])
-        self.style.configure("App.TNotebook.Tab", background=palette["app_bg"], foreground=palette["tab_unselected_fg"])
-        self.style.map(
-            "App.TNotebook.Tab",
-            background=[("selected", palette["card_bg"]), ("!selected", palette["app_bg"])],
-            foreground=[("selected", palette["tab_selected_fg"]), ("!selected", palette["tab_unselected_fg"])],
-        )
-
-        self.style.configure("Accent.TButton", background=palette["accent_color"], foreground=palette["text_on_accent"])
-        self.style.map(
-            "Accent.TButton",
-            background=[
-                ("disabled", palette["accent_disabled"]),
-                ("pressed", palette["accent_active"]),
-                ("active", palette["accent_hover"]),
-            ],
-            foreground=[("disabled", palette["text_on_disabled"])],
-        )
-
-        self.style.configure("Danger.TButton", background=palette["danger_color"], foreground=palette["text_on_accent"])
-        self.style.map(
-            "Danger.TButton",
-            background=[
-                ("disabled", palette["danger_disabled"]),
-                ("pressed", palette["danger_active"]),
-                ("active", palette["danger_hover"]),
-            ],
-            foreground=[("disabled", palette["text_on_disabled"])],
-        )
+        configures, maps = self._resolve_theme(dark)
+        configure = self.style.configure
+        for style_name, options in configures:
+            configure(style_name, **options)
+        style_map = self.style.map
+        for style_name, options in maps:
+            style_map(style_name, **options)
 
-        self.style.configure("Ghost.TButton", background=palette["ghost_bg"], foreground=palette["text_primary"])
-        self.style.map(
-            "Ghost.TButton",
-            background=[
-                ("pressed", palette["ghost_active"]),
-                ("active", palette["ghost_hover"]),
-            ],
-        )
-
-        self.style.configure(
-            "AccentCard.TSpinbox",
-            fieldbackground=palette["entry_bg"],
-            background=palette["entry_bg"],
-            foreground=palette["entry_fg"],
-        )
-        self.style.map(
-            "AccentCard.TSpinbox",
-            fieldbackground=[("disabled", palette["entry_bg"]), ("readonly", palette["entry_bg"])],
-            foreground=[("disabled", palette["text_muted"])],
-            arrowcolor=[("active", palette["accent_hover"]), ("!active", palette["accent_color"])],
-        )
-
-        self.style.configure(
-            "AccentCard.TCombobox",
-            fieldbackground=palette["entry_bg"],
-            background=palette["entry_bg"],
-            foreground=palette["entry_fg"],
-        )
-        self.style.map(
-            "AccentCard.TCombobox",
-            fieldbackground=[("readonly", palette["entry_bg"]), ("disabled", palette["entry_bg"])],
-            foreground=[("disabled", palette["text_muted"])],
-        )
-
-        if not initial:
-            self._apply_widget_theme()
+        self._apply_widget_theme()
+        self._applied_palette_is_dark = dark
 
     def _apply_widget_theme(self) -> None:
-        if not hasattr(self, "_current_palette"):
-            return
-        palette = self._current_palette
-
         if hasattr(self, "position_listbox"):
-            self.position_listbox.configure(
-                bg=palette["list_bg"],
-                fg=palette["list_fg"],
-                selectbackground=palette["accent_color"],
-                selectforeground=palette["text_on_accent"],
-                highlightbackground=palette["border_color"],
-                highlightcolor=palette["highlight"],
-                relief=tk.FLAT,
-            )
+            self.position_listbox.configure(**self._listbox_cfg)
 
         if hasattr(self, "log_text"):
-            self.log_text.configure(
-                background=palette["text_area_bg"],
-                foreground=palette["text_primary"],
-                insertbackground=palette["text_primary"],
-            )
+            self.log_text.configure(**self._log_text_cfg)
 
     def _on_dark_mode_toggle(self) -> None:
         self._apply_theme()
@@ -526,8 +748,21 @@ class AutoClickerGUI:
 
         self._build_status_section(status_container)
 
-        self._build_automation_tab(automation_tab)
-        self._build_options_tab(options_tab)
+        # The automation and options tabs are built the first time they are selected
+        self._notebook = notebook
+        self._pending_tabs: Dict[str, Tuple[Callable[[ttk.Frame], None], ttk.Frame]] = {
+            str(automation_tab): (self._build_automation_tab, automation_tab),
+            str(options_tab): (self._build_options_tab, options_tab),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event: Optional[tk.Event] = None) -> None:
+        if not self._pending_tabs:
+            return
+        pending = self._pending_tabs.pop(self._notebook.select(), None)
+        if pending is not None:
+            build, tab = pending
+            build(tab)
 
     def _build_position_section(self, parent: ttk.Frame) -> None:
         frame = ttk.LabelFrame(parent, text="Klick-Positionen", padding=14, style="Card.TLabelframe")
@@ -565,67 +800,22 @@ class AutoClickerGUI:
         btn_frame.grid(row=2, column=0, columnspan=4, sticky="ew", pady=(0, 6))
         btn_frame.columnconfigure((0, 1, 2), weight=1)
 
-        self.add_current_button = ttk.Button(
-            btn_frame,
-            text="Aktuelle Position",
-            command=self._add_current_position,
-            style="Ghost.TButton",
-        )
-        self.add_current_button.grid(row=0, column=0, padx=4, pady=4, sticky="ew")
-
-        self.add_custom_button = ttk.Button(
-            btn_frame,
-            text="Benutzerdefiniert",
-            command=self._add_custom_position,
-            style="Ghost.TButton",
-        )
-        self.add_custom_button.grid(row=0, column=1, padx=4, pady=4, sticky="ew")
-
-        self.capture_button = ttk.Button(
-            btn_frame,
-            text="Nächsten Klick aufnehmen",
-            command=self._capture_next_position,
-            style="Accent.TButton",
-        )
-        self.capture_button.grid(row=0, column=2, padx=4, pady=4, sticky="ew")
-
-        self.capture_cancel_button = ttk.Button(
-            btn_frame,
-            text="Aufnahme stoppen",
-            command=self._cancel_capture,
-            style="Danger.TButton",
-        )
-        self.capture_cancel_button.grid(row=1, column=0, padx=4, pady=4, sticky="ew")
-
-        self.remove_selected_button = ttk.Button(
-            btn_frame,
-            text="Entfernen",
-            command=self._remove_selected_position,
-            style="Ghost.TButton",
-        )
-        self.remove_selected_button.grid(row=1, column=1, padx=4, pady=4, sticky="ew")
-
-        self.clear_all_button = ttk.Button(
-            btn_frame,
-            text="Alle löschen",
-            command=self._clear_all_positions,
-            style="Ghost.TButton",
+        # (attribute or None, text, command, style, row, column, columnspan)
+        buttons = (
+            ("add_current_button", "Aktuelle Position", self._add_current_position, "Ghost.TButton", 0, 0, 1),
+            ("add_custom_button", "Benutzerdefiniert", self._add_custom_position, "Ghost.TButton", 0, 1, 1),
+            ("capture_button", "Nächsten Klick aufnehmen", self._capture_next_position, "Accent.TButton", 0, 2, 1),
+            ("capture_cancel_button", "Aufnahme stoppen", self._cancel_capture, "Danger.TButton", 1, 0, 1),
+            ("remove_selected_button", "Entfernen", self._remove_selected_position, "Ghost.TButton", 1, 1, 1),
+            ("clear_all_button", "Alle löschen", self._clear_all_positions, "Ghost.TButton", 1, 2, 1),
+            (None, "Duplizieren", self._duplicate_selected_position, "Ghost.TButton", 2, 0, 1),
+            (None, "Kopieren", self._copy_position_to_clipboard, "Ghost.TButton", 2, 1, 2),
         )
-        self.clear_all_button.grid(row=1, column=2, padx=4, pady=4, sticky="ew")
-
-        ttk.Button(
-            btn_frame,
-            text="Duplizieren",
-            command=self._duplicate_selected_position,
-            style="Ghost.TButton",
-        ).grid(row=2, column=0, padx=4, pady=4, sticky="ew")
-
-        ttk.Button(
-            btn_frame,
-            text="Kopieren",
-            command=self._copy_position_to_clipboard,
-            style="Ghost.TButton",
-        ).grid(row=2, column=1, columnspan=2, padx=4, pady=4, sticky="ew")
+        for attr, text, command, style, row, column, columnspan in buttons:
+            button = ttk.Button(btn_frame, text=text, command=command, style=style)
+            button.grid(row=row, column=column, columnspan=columnspan, padx=4, pady=4, sticky="ew")
+            if attr is not None:
+                setattr(self, attr, button)
 
         ttk.Label(frame, textvariable=self.capture_status_var).grid(
             row=3,
@@ -685,7 +875,7 @@ class AutoClickerGUI:
                 ttk.Combobox(
                     frame,
                     textvariable=self.click_type_var,
-                    values=[choice.value for choice in ClickType],
+                    values=_CLICK_TYPE_VALUES,
                     state="readonly",
                     style="AccentCard.TCombobox",
                     width=18,
@@ -902,16 +1092,17 @@ class AutoClickerGUI:
         ).grid(row=0, column=2)
 
     def _clear_log_output(self) -> None:
+        self._flush_log()
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.delete("1.0", tk.END)
         self.log_text.configure(state=tk.DISABLED)
+        self._log_tail.clear()
         self.status_var.set("Status: Loganzeige gelöscht.")
         self.logger.log_info("Loganzeige gelöscht.")
 
     def _copy_logs_to_clipboard(self) -> None:
-        self.log_text.configure(state=tk.NORMAL)
-        content = self.log_text.get("1.0", tk.END).strip()
-        self.log_text.configure(state=tk.DISABLED)
+        self._flush_log()
+        content = "\n".join(self._log_tail).strip()
         if not content:
             self.status_var.set("Status: Log ist leer.")
             return
@@ -920,43 +1111,63 @@ class AutoClickerGUI:
         self.status_var.set("Status: Log in Zwischenablage.")
         self.logger.log_info("Log in Zwischenablage kopiert.")
 
-    def _update_click_metrics(self) -> None:
+    def _update_cached_click_mode(self, *_args: Any) -> None:
+        mode = _CLICK_MODE_BY_VALUE.get(self.click_mode_var.get())
+        if mode is not None:
+            self._cached_click_mode = mode
+
+    def _update_cached_click_type(self, *_args: Any) -> None:
+        click_type = _CLICK_TYPE_BY_VALUE.get(self.click_type_var.get())
+        if click_type is not None:
+            self._cached_click_type = click_type
+
+    def _on_numeric_changed(self, *_args: Any) -> None:
         try:
             rate = float(self.click_rate_var.get())
         except (tk.TclError, ValueError):
-            rate = 0.0
-
-        if rate > 0:
-            interval_ms = 1000.0 / rate
-            self.click_interval_hint_var.set(f"Intervall zwischen Klicks: {interval_ms:.1f} ms")
-        else:
-            self.click_interval_hint_var.set("Intervall zwischen Klicks: –")
-
+            rate = None
         try:
             total = int(self.total_clicks_var.get())
         except (tk.TclError, ValueError):
-            total = 0
+            total = None
+        self._validated_rate = max(rate, 0.01) if rate is not None else None
+        self._validated_total = max(total, 0) if total is not None else None
+        self._metrics_inputs = (rate or 0.0, total or 0)
+        if self._metrics_after_id is not None:
+            self.root.after_cancel(self._metrics_after_id)
+        self._metrics_after_id = self.root.after(self.METRICS_DEBOUNCE_MS, self._do_update_click_metrics)
+
+    def _do_update_click_metrics(self) -> None:
+        self._metrics_after_id = None
+        self._update_click_metrics(*self._metrics_inputs)
+
+    def _update_click_metrics(self, rate: float, total: int) -> None:
+        if rate > 0:
+            interval_text = _INTERVAL_HINT_FMT.format(1000.0 / rate)
+        else:
+            interval_text = _INTERVAL_HINT_NONE
+        if interval_text != self._last_interval_hint:
+            self._last_interval_hint = interval_text
+            self.click_interval_hint_var.set(interval_text)
 
         if total == 0:
-            self.estimated_duration_var.set("Geschätzte Dauer: unbegrenzt (0 = unbegrenzt)")
-            return
-
-        if rate <= 0:
-            self.estimated_duration_var.set("Geschätzte Dauer: –")
-            return
-
-        seconds = total / rate
-        if seconds >= 3600:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            self.estimated_duration_var.set(f"Geschätzte Dauer: {hours}h {minutes}m {secs}s")
-        elif seconds >= 60:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            self.estimated_duration_var.set(f"Geschätzte Dauer: {minutes}m {secs}s")
+            duration_text = _DURATION_UNLIMITED
+        elif rate <= 0:
+            duration_text = _DURATION_NONE
         else:
-            self.estimated_duration_var.set(f"Geschätzte Dauer: {seconds:.1f}s")
+            seconds = total / rate
+            if seconds < 60:
+                duration_text = _DURATION_FMT_S.format(seconds)
+            else:
+                minutes, secs = divmod(int(seconds), 60)
+                hours, minutes = divmod(minutes, 60)
+                if hours:
+                    duration_text = _DURATION_FMT_H.format(hours, minutes, secs)
+                else:
+                    duration_text = _DURATION_FMT_M.format(minutes, secs)
+        if duration_text != self._last_duration_str:
+            self._last_duration_str = duration_text
+            self.estimated_duration_var.set(duration_text)
 
     def _build_automation_tab(self, parent: ttk.Frame) -> None:
         parent.columnconfigure(0, weight=1)
@@ -1103,17 +1314,29 @@ class AutoClickerGUI:
     # Position management
     # ------------------------------------------------------------------
     def _add_current_position(self) -> None:
-        x, y = pyautogui.position()
+        x, y = self._cursor_xy or cursor_position() or self.root.winfo_pointerxy()
         position = ClickPosition(x=int(x), y=int(y))
-        self.click_positions.append(position)
-        self._after_positions_updated(f"Position hinzugefügt: {position}")
+        self._append_position(position, f"Position hinzugefügt: {position}")
 
     def _add_custom_position(self) -> None:
+        # The dialog is built once and only hidden between uses
+        if self._custom_pos_dialog is None or not self._custom_pos_dialog.winfo_exists():
+            self._build_custom_position_dialog()
+        dialog = self._custom_pos_dialog
+        x_var, y_var, label_var, status_var = self._custom_pos_vars
+        x_var.set("0")
+        y_var.set("0")
+        label_var.set("")
+        status_var.set("")
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.focus_set()
+
+    def _build_custom_position_dialog(self) -> None:
         dialog = tk.Toplevel(self.root)
         dialog.title("Position hinzufügen")
         dialog.geometry("280x200")
         dialog.transient(self.root)
-        dialog.grab_set()
 
         x_var = tk.StringVar(value="0")
         y_var = tk.StringVar(value="0")
@@ -1131,21 +1354,29 @@ class AutoClickerGUI:
         status_var = tk.StringVar(value="")
         ttk.Label(dialog, textvariable=status_var, foreground="red").pack(pady=4)
 
+        def hide() -> None:
+            dialog.grab_release()
+            dialog.withdraw()
+
         def submit() -> None:
             try:
                 x_value = int(x_var.get())
                 y_value = int(y_var.get())
                 label_value = label_var.get().strip() or None
-                self.click_positions.append(ClickPosition(x=x_value, y=y_value, label=label_value))
-                dialog.destroy()
-                self._after_positions_updated(
-                    f"Position hinzugefügt: {label_value or ''} ({x_value}, {y_value})"
+                hide()
+                self._append_position(
+                    ClickPosition(x=x_value, y=y_value, label=label_value),
+                    f"Position hinzugefügt: {label_value or ''} ({x_value}, {y_value})",
                 )
             except ValueError:
                 status_var.set("Bitte gültige Ganzzahlen eingeben.")
 
         ttk.Button(dialog, text="Hinzufügen", command=submit).pack(pady=(12, 0))
-        ttk.Button(dialog, text="Abbrechen", command=dialog.destroy).pack(pady=(4, 0))
+        ttk.Button(dialog, text="Abbrechen", command=hide).pack(pady=(4, 0))
+        dialog.protocol("WM_DELETE_WINDOW", hide)
+
+        self._custom_pos_dialog = dialog
+        self._custom_pos_vars = (x_var, y_var, label_var, status_var)
 
     def _capture_next_position(self) -> None:
         if self.capture_in_progress:
@@ -1171,8 +1402,7 @@ class AutoClickerGUI:
     def _on_click_captured(self, x: int, y: int) -> None:
         self.capture_in_progress = False
         self.capture_status_var.set("Position aufgenommen.")
-        self.click_positions.append(ClickPosition(x=x, y=y))
-        self._after_positions_updated(f"Position aufgenommen: ({x}, {y})")
+        self._append_position(ClickPosition(x=x, y=y), f"Position aufgenommen: ({x}, {y})")
 
     def _on_capture_error(self, exc: Exception) -> None:  # pragma: no cover - platform specific
         self.capture_in_progress = False
@@ -1220,11 +1450,38 @@ class AutoClickerGUI:
         self.click_positions.clear()
         self._after_positions_updated("Alle Positionen gelöscht")
 
+    @staticmethod
+    def _format_position_row(idx: int, x: int, y: int, label: Optional[str]) -> str:
+        return f"{idx}. {label or f'#{idx}'} @ ({x}, {y})"
+
     def _refresh_position_list(self) -> None:
-        self.position_listbox.delete(0, tk.END)
-        for idx, position in enumerate(self.click_positions, start=1):
-            label = position.label or f"#{idx}"
-            self.position_listbox.insert(tk.END, f"{idx}. {label} @ ({position.x}, {position.y})")
+        fmt = self._format_position_row
+        new = [
+            fmt(idx, x, y, label)
+            for idx, (x, y, label) in enumerate(zip(self._pos_xs, self._pos_ys, self._pos_labels), start=1)
+        ]
+        old = self._listbox_cache
+        listbox = self.position_listbox
+        # Only rewrite rows that differ, then trim or extend the tail
+        for i in range(min(len(old), len(new))):
+            if old[i] != new[i]:
+                listbox.delete(i)
+                listbox.insert(i, new[i])
+        if len(new) < len(old):
+            listbox.delete(len(new), tk.END)
+        elif len(new) > len(old):
+            listbox.insert(tk.END, *new[len(old):])
+        self._listbox_cache = new
+        self._update_position_count()
+
+    def _append_position_row(self, position: ClickPosition) -> None:
+        """Show one position appended at the end; earlier rows keep their numbers."""
+        row = self._format_position_row(len(self._listbox_cache) + 1, position.x, position.y, position.label)
+        self.position_listbox.insert(tk.END, row)
+        self._listbox_cache.append(row)
+        self._update_position_count()
+
+    def _update_position_count(self) -> None:
         count = len(self.click_positions)
         if count == 1:
             self.position_count_var.set("1 Position gespeichert")
@@ -1232,24 +1489,50 @@ class AutoClickerGUI:
             self.position_count_var.set(f"{count} Positionen gespeichert")
 
     def _reset_manual_statistics(self) -> None:
-        self.click_count_var.set("Ausgeführte Klicks: 0")
-        self.manual_cps_var.set("Aktuelle CPS: 0.00")
+        binding = self._manual_binding
+        self._flush_ui(binding, binding.click_reset_text, binding.cps_reset_text)
         if "engine" in self._cps_tracker:
             self._reset_cps_tracker("engine", 0)
         self._log_message("Manuelle Statistiken zurückgesetzt.")
 
     def _reset_automation_statistics(self) -> None:
-        self.automation_clicks_var.set("Klicks (Automatisierung): 0")
-        self.automation_cps_var.set("CPS (Automatisierung): 0.00")
+        binding = self._automation_binding
+        self._flush_ui(binding, binding.click_reset_text, binding.cps_reset_text)
         if "automation_engine" in self._cps_tracker:
             self._reset_cps_tracker("automation_engine", 0)
         self._log_message("Automatisierungsstatistiken zurückgesetzt.")
         # Script status is independent
         self.script_status_var.set("Script: Bereit")
 
+    def _positions_tuple(self) -> Tuple[ClickPosition, ...]:
+        snapshot = self._positions_snapshot
+        if snapshot is None:
+            snapshot = self._positions_snapshot = tuple(self.click_positions)
+        return snapshot
+
+    def _sync_position_columns(self) -> None:
+        positions = self.click_positions
+        self._pos_xs = array("i", [p.x for p in positions])
+        self._pos_ys = array("i", [p.y for p in positions])
+        self._pos_labels = [p.label for p in positions]
+
+    def _append_position(self, position: ClickPosition, message: str) -> None:
+        """Append one position; extends the columns and the listbox instead of rebuilding them."""
+        self.click_positions.append(position)
+        self._pos_xs.append(position.x)
+        self._pos_ys.append(position.y)
+        self._pos_labels.append(position.label)
+        self._append_position_row(position)
+        self._positions_changed(message)
+
     def _after_positions_updated(self, message: str) -> None:
+        self._sync_position_columns()
         self._refresh_position_list()
-        self.debug_overlay.set_positions(self.click_positions)
+        self._positions_changed(message)
+
+    def _positions_changed(self, message: str) -> None:
+        self._positions_snapshot = None
+        self.debug_overlay.set_position_columns(self._pos_xs, self._pos_ys, self._pos_labels)
         self._log_message(message)
         self._persist_settings()
 
@@ -1263,38 +1546,14 @@ class AutoClickerGUI:
             messagebox.showerror("Konfiguration ungültig", str(exc))
             return
 
-        self._start_engine(
-            engine_attr="engine",
-            config=config,
-            status_var=self.status_var,
-            click_var=self.click_count_var,
-            click_reset_text="Ausgeführte Klicks: 0",
-            cps_var=self.manual_cps_var,
-            cps_reset_text="Aktuelle CPS: 0.00",
-            update_job_attr="manual_update_job",
-            minimize=False,
-            on_success="Manueller Start ausgeführt.",
-            click_prefix="Ausgeführte Klicks",
-            status_running_text="Status: Läuft",
-            status_ready_text="Status: Bereit",
-            cps_prefix="Aktuelle CPS",
-        )
+        self._start_engine(self._manual_binding, config, minimize=False, on_success="Manueller Start ausgeführt.")
 
     def _stop_manual_clicking(self) -> None:
-        self._stop_engine(
-            engine_attr="engine",
-            status_var=self.status_var,
-            click_var=self.click_count_var,
-            click_reset_text="Ausgeführte Klicks: 0",
-            cps_var=self.manual_cps_var,
-            cps_reset_text="Aktuelle CPS: 0.00",
-            update_job_attr="manual_update_job",
-            status_ready_text="Status: Bereit",
-        )
+        self._stop_engine(self._manual_binding)
 
     def _start_automation(self) -> None:
         try:
-            total_override = 0 if self.automation_infinite_var.get() else self.total_clicks_var.get()
+            total_override = 0 if self.automation_infinite_var.get() else self._validated_total
             config = self._build_configuration(
                 run_in_background=True,
                 total_override=total_override,
@@ -1304,34 +1563,10 @@ class AutoClickerGUI:
             return
 
         minimize = self.automation_minimize_var.get()
-        self._start_engine(
-            engine_attr="automation_engine",
-            config=config,
-            status_var=self.automation_status_var,
-            click_var=self.automation_clicks_var,
-            click_reset_text="Klicks (Automatisierung): 0",
-            cps_var=self.automation_cps_var,
-            cps_reset_text="CPS (Automatisierung): 0.00",
-            update_job_attr="automation_update_job",
-            minimize=minimize,
-            on_success="Automatisierung gestartet.",
-            click_prefix="Klicks (Automatisierung)",
-            status_running_text="Automatisierung: Läuft",
-            status_ready_text="Automatisierung: Bereit",
-            cps_prefix="CPS (Automatisierung)",
-        )
+        self._start_engine(self._automation_binding, config, minimize=minimize, on_success="Automatisierung gestartet.")
 
     def _stop_automation(self) -> None:
-        self._stop_engine(
-            engine_attr="automation_engine",
-            status_var=self.automation_status_var,
-            click_var=self.automation_clicks_var,
-            click_reset_text="Klicks (Automatisierung): 0",
-            cps_var=self.automation_cps_var,
-            cps_reset_text="CPS (Automatisierung): 0.00",
-            update_job_attr="automation_update_job",
-            status_ready_text="Automatisierung: Bereit",
-        )
+        self._stop_engine(self._automation_binding)
 
     def _build_configuration(
         self,
@@ -1339,171 +1574,163 @@ class AutoClickerGUI:
         run_in_background: bool,
         total_override: Optional[int] = None,
     ) -> ClickConfiguration:
-        mode = ClickMode(self.click_mode_var.get())
-        positions = list(self.click_positions)
+        mode = self._cached_click_mode
+        positions = self._positions_tuple()
 
         if mode == ClickMode.STATIC_SEQUENCE and not positions:
             raise ValueError("Für den Positionsmodus müssen Zielpunkte vorhanden sein.")
 
-        total_clicks = self.total_clicks_var.get() if total_override is None else total_override
+        rate = self._validated_rate
+        if rate is None:
+            raise ValueError("Die Klickrate muss eine Zahl sein.")
+        total_clicks = self._validated_total if total_override is None else total_override
+        if total_clicks is None:
+            raise ValueError("Die Anzahl der Klicks muss eine ganze Zahl sein.")
 
         return ClickConfiguration(
             click_positions=positions,
-            click_rate_per_second=max(float(self.click_rate_var.get()), 0.01),
-            total_clicks=max(int(total_clicks), 0),
-            click_type=ClickType(self.click_type_var.get()),
+            click_rate_per_second=rate,
+            total_clicks=total_clicks,
+            click_type=self._cached_click_type,
             click_mode=mode,
             run_in_background=run_in_background,
         )
 
     def _start_engine(
         self,
-        *,
-        engine_attr: str,
+        binding: EngineBinding,
         config: ClickConfiguration,
-        status_var: tk.StringVar,
-        click_var: tk.StringVar,
-        click_reset_text: str,
-        cps_var: tk.StringVar,
-        cps_reset_text: str,
-        update_job_attr: str,
+        *,
         minimize: bool,
         on_success: str,
-        click_prefix: str,
-        status_running_text: str,
-        status_ready_text: str,
-        cps_prefix: str,
     ) -> None:
+        engine_attr = binding.engine_attr
         engine: Optional[AutoClickerEngine] = getattr(self, engine_attr)
         if engine and engine.is_running():
             self._log_message("Klicker läuft bereits.")
             return
 
-        existing_job = getattr(self, update_job_attr, None)
-        if existing_job:
-            self.root.after_cancel(existing_job)
-            setattr(self, update_job_attr, None)
-
         engine = AutoClickerEngine(config)
-        engine.register_status_callback(lambda msg: self._log_message(msg))
+        engine.register_status_callback(lambda msg: self._engine_queue.put((self._log_message, (msg,))))
+        events: Deque[Tuple[int, float]] = deque(maxlen=64)
+        self._click_events[engine_attr] = events
+        self._click_drain_pending.discard(engine_attr)
+
+        def on_clicks(count: int) -> None:
+            # Worker thread: record the sample, queue one drain at a time
+            events.append((count, time.perf_counter()))
+            if engine_attr not in self._click_drain_pending:
+                self._click_drain_pending.add(engine_attr)
+                self._engine_queue.put(
+                    (self._drain_click_events, (binding, engine))
+                )
+
+        engine.register_click_callback(on_clicks)
         setattr(self, engine_attr, engine)
 
         if engine.start():
-            status_var.set(status_running_text)
-            click_var.set(click_reset_text)
-            cps_var.set(cps_reset_text)
+            self._flush_ui(binding, binding.click_reset_text, binding.cps_reset_text, binding.status_running_text)
             self._reset_cps_tracker(engine_attr, 0)
+            self._last_click_paint[engine_attr] = 0.0
             self._log_message(on_success)
             if minimize:
                 self.root.iconify()
-            self._schedule_click_update(
-                engine_attr=engine_attr,
-                click_var=click_var,
-                cps_var=cps_var,
-                update_job_attr=update_job_attr,
-                click_prefix=click_prefix,
-                cps_prefix=cps_prefix,
-            )
         else:
             self._log_message("Klicker konnte nicht gestartet werden", level="WARNING")
-            status_var.set(status_ready_text)
-            cps_var.set(cps_reset_text)
+            self._flush_ui(binding, None, binding.cps_reset_text, binding.status_ready_text)
 
-    def _stop_engine(
-        self,
-        *,
-        engine_attr: str,
-        status_var: tk.StringVar,
-        click_var: tk.StringVar,
-        click_reset_text: str,
-        cps_var: tk.StringVar,
-        cps_reset_text: str,
-        update_job_attr: str,
-        status_ready_text: str,
-    ) -> None:
+    def _stop_engine(self, binding: EngineBinding) -> None:
+        engine_attr = binding.engine_attr
         engine: Optional[AutoClickerEngine] = getattr(self, engine_attr)
         if engine and engine.is_running():
             engine.stop()
             self._log_message("Klicker gestoppt.")
         setattr(self, engine_attr, None)
-        job = getattr(self, update_job_attr, None)
-        if job:
-            self.root.after_cancel(job)
-            setattr(self, update_job_attr, None)
-        status_var.set(status_ready_text)
-        click_var.set(click_reset_text)
-        cps_var.set(cps_reset_text)
+        self._click_events.pop(engine_attr, None)
+        self._flush_ui(binding, binding.click_reset_text, binding.cps_reset_text, binding.status_ready_text)
         self._cps_tracker.pop(engine_attr, None)
 
-    def _schedule_click_update(
-        self,
-        *,
-        engine_attr: str,
-        click_var: tk.StringVar,
-        cps_var: tk.StringVar,
-        update_job_attr: str,
-        click_prefix: str,
-        cps_prefix: str,
-    ) -> None:
-        engine: Optional[AutoClickerEngine] = getattr(self, engine_attr)
-        if not engine:
+    def _drain_engine_queue(self) -> None:
+        """Run handlers posted by worker threads, at most ENGINE_QUEUE_BATCH per tick."""
+        engine_queue = self._engine_queue
+        for _ in range(self.ENGINE_QUEUE_BATCH):
+            try:
+                handler, args = engine_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(*args)
+            except Exception:
+                # One failing handler must not stop the pump for good
+                self.root.report_callback_exception(*sys.exc_info())
+        if engine_queue.empty():
+            self._engine_queue_job = self.root.after(self.ENGINE_QUEUE_POLL_MS, self._drain_engine_queue)
+        else:
+            self._engine_queue_job = self.root.after_idle(self._drain_engine_queue)
+
+    def _drain_click_events(self, binding: EngineBinding, engine: AutoClickerEngine) -> None:
+        engine_attr = binding.engine_attr
+        self._click_drain_pending.discard(engine_attr)
+        if getattr(self, engine_attr) is not engine:
+            return  # Stopped or replaced in the meantime
+        events = self._click_events.get(engine_attr)
+        if not events:
             return
+        running = engine.is_running()
+        now = time.perf_counter()
+        if running and now - self._last_click_paint.get(engine_attr, 0.0) < self.CLICK_UI_MIN_INTERVAL:
+            return  # Keep the sample; the next push paints it
+        executed = events[-1][0]
+        events.clear()
+        self._last_click_paint[engine_attr] = now
+        if running:
+            cps_text = binding.cps_fmt(self._update_cps(engine_attr=engine_attr, current_clicks=executed))
+        else:
+            cps_text = binding.cps_reset_text
+            self._cps_tracker.pop(engine_attr, None)
+        self._flush_ui(binding, binding.click_fmt(executed), cps_text)
 
-        def poll() -> None:
-            engine_poll: Optional[AutoClickerEngine] = getattr(self, engine_attr)
-            if engine_poll and engine_poll.is_running():
-                executed = engine_poll.get_clicks_executed()
-                click_var.set(f"{click_prefix}: {executed}")
-                self._update_cps(
-                    engine_attr=engine_attr,
-                    current_clicks=executed,
-                    cps_var=cps_var,
-                    cps_prefix=cps_prefix,
-                )
-                job_id = self.root.after(self.CLICK_COUNTER_POLL_MS, poll)
-                setattr(self, update_job_attr, job_id)
-            else:
-                setattr(self, update_job_attr, None)
-                cps_var.set(f"{cps_prefix}: 0.00")
-                self._cps_tracker.pop(engine_attr, None)
-
-        poll()
+    def _flush_ui(
+        self,
+        binding: EngineBinding,
+        clicks_text: Optional[str],
+        cps_text: Optional[str],
+        status_text: Optional[str] = None,
+    ) -> None:
+        """Write an engine's click/CPS/status texts, skipping unchanged ones.
+
+        Every StringVar.set is a Tcl call plus a label redraw, so the click and
+        CPS texts are compared against the last written value first. The status
+        line is always written because _log_message shares that variable.
+        """
+        engine_attr = binding.engine_attr
+        last = self._last_ui_strings
+        if clicks_text is not None and last.get((engine_attr, "clicks")) != clicks_text:
+            last[(engine_attr, "clicks")] = clicks_text
+            binding.click_var.set(clicks_text)
+        if cps_text is not None and last.get((engine_attr, "cps")) != cps_text:
+            last[(engine_attr, "cps")] = cps_text
+            binding.cps_var.set(cps_text)
+        if status_text is not None:
+            binding.status_var.set(status_text)
 
     def _reset_cps_tracker(self, engine_attr: str, clicks: int) -> None:
-        self._cps_tracker[engine_attr] = {
-            "count": clicks,
-            "time": time.perf_counter(),
-        }
+        self._cps_tracker[engine_attr] = _CpsTracker(time.perf_counter(), clicks)
 
     def _update_cps(
         self,
         *,
         engine_attr: str,
         current_clicks: int,
-        cps_var: tk.StringVar,
-        cps_prefix: str,
-    ) -> None:
+    ) -> float:
         now = time.perf_counter()
         tracker = self._cps_tracker.get(engine_attr)
-        if tracker is None:
-            self._cps_tracker[engine_attr] = {"count": current_clicks, "time": now}
-            cps_var.set(f"{cps_prefix}: 0.00")
-            return
-
-        delta_clicks = current_clicks - tracker["count"]
-        if delta_clicks < 0:
+        if tracker is None or current_clicks < tracker.last_clicks:
             self._reset_cps_tracker(engine_attr, current_clicks)
-            cps_var.set(f"{cps_prefix}: 0.00")
-            return
+            return 0.0
 
-        delta_time = now - tracker["time"]
-        if delta_time <= 0 or delta_time < 0.05:
-            return
-
-        cps_value = delta_clicks / delta_time if delta_time > 0 else 0.0
-        cps_var.set(f"{cps_prefix}: {cps_value:.2f}")
-        tracker["count"] = current_clicks
-        tracker["time"] = now
+        tracker.push(now, current_clicks)
+        return tracker.rate(now, self.CPS_WINDOW)
 
     # ------------------------------------------------------------------
     # Hotkeys & logging
@@ -1524,16 +1751,21 @@ class AutoClickerGUI:
         else:
             messagebox.showwarning("Hotkeys", "Hotkeys konnten nicht aktualisiert werden.")
 
+    # Hotkey handlers run on the hook thread and must return at once: they
+    # make no Tk calls, only post one item to the engine queue.
     def _handle_hotkey_start(self) -> None:
         if self.engine and self.engine.is_running():
             return
-        self.root.after(0, self._start_manual_clicking)
+        self._engine_queue.put((self._start_manual_clicking, ()))
 
     def _handle_hotkey_stop(self) -> None:
+        self._engine_queue.put((self._do_stop_all, ()))
+
+    def _do_stop_all(self) -> None:
         if self.engine and self.engine.is_running():
-            self.root.after(0, self._stop_manual_clicking)
+            self._stop_manual_clicking()
         if self.automation_engine and self.automation_engine.is_running():
-            self.root.after(0, self._stop_automation)
+            self._stop_automation()
         # Also stop any running script automation loop
         if self.script_engine and self.script_engine.is_running():
             try:
@@ -1543,19 +1775,53 @@ class AutoClickerGUI:
                 pass
 
     def _log_message(self, message: str, level: str = "INFO") -> None:
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
-
-        if level == "INFO":
-            self.logger.log_info(message)
-        elif level == "WARNING":
-            self.logger.log_warning(message)
-        else:
-            self.logger.log_error(message)
-
-        self.status_var.set(f"Status: {message}")
+        self._log_buffer.append((message, level))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Hand buffered messages to the logger, write them to the widget in one
+        insert (capped at LOG_MAX_LINES) and show the last one in the status line."""
+        self._log_flush_pending = False
+        pending = self._log_buffer
+        if not pending:
+            return
+        logger = self.logger
+        for message, level in pending:
+            if level == "INFO":
+                logger.log_info(message)
+            elif level == "WARNING":
+                logger.log_warning(message)
+            else:
+                logger.log_error(message)
+        last_message = pending[-1][0]
+        messages = [message for message, _ in pending]
+        self._log_widget_pending.extend(messages)
+        self._log_tail.extend(messages)
+        pending.clear()
+        self.status_var.set(f"Status: {last_message}")
+        if self._ui_visible.is_set():
+            self._write_log_widget()
+
+    def _write_log_widget(self) -> None:
+        lines = self._log_widget_pending
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        lines.clear()
+        log_text = self.log_text
+        # Scrolled up to read history: append, but neither trim nor jump to the end
+        follow = log_text.yview()[1] >= 0.99
+        log_text.configure(state=tk.NORMAL)
+        log_text.insert(tk.END, text)
+        if follow:
+            # The widget always ends with an empty line after the trailing newline
+            excess = int(log_text.index("end-1c").split(".")[0]) - 1 - self.LOG_MAX_LINES
+            if excess > 0:
+                log_text.delete("1.0", f"{excess + 1}.0")
+            log_text.see(tk.END)
+        log_text.configure(state=tk.DISABLED)
 
     # ------------------------------------------------------------------
     # Script automation helpers
@@ -1868,6 +2134,37 @@ class AutoClickerGUI:
                 summary += f" — {amt} ({direction})"
             self.script_actions_listbox.insert(tk.END, f"{i}. {summary}")
 
+    def _ensure_builder_vars(self) -> None:
+        """Create the builder's Tk variables; only the builder window and editor sync use them."""
+        if self._builder_vars_ready:
+            return
+        self._builder_vars_ready = True
+        self.builder_action_type = tk.StringVar(value="type_text")
+        self.builder_text_var = tk.StringVar(value="Hello from Script!")
+        self.builder_sequence_var = tk.StringVar(value="<ENTER>")
+        self.builder_wait_ms_var = tk.IntVar(value=300)
+        self.builder_command_var = tk.StringVar(value="notepad.exe")
+        self.builder_args_var = tk.StringVar(value="")
+        self.builder_title_var = tk.StringVar(value="")
+        self.builder_template_var = tk.StringVar(value="Vorlage wählen…")
+        # Mouse/Scroll builder vars
+        self.builder_click_x_var = tk.StringVar(value="")  # allow blank for current cursor
+        self.builder_click_y_var = tk.StringVar(value="")
+        self.builder_click_button_var = tk.StringVar(value="left")
+        self.builder_click_count_var = tk.IntVar(value=1)
+        self.builder_scroll_amount_var = tk.IntVar(value=300)
+        self.builder_scroll_horizontal_var = tk.BooleanVar(value=False)
+        self.builder_autosync_var = tk.BooleanVar(value=True)
+        # Loop builder vars
+        self.builder_repeat_count_var = tk.IntVar(value=1)
+        self.builder_until_stopped_var = tk.BooleanVar(value=False)
+        # Autosync traces for loop fields
+        try:
+            self.builder_repeat_count_var.trace_add("write", lambda *_: self._builder_maybe_autosync())
+            self.builder_until_stopped_var.trace_add("write", lambda *_: self._builder_maybe_autosync())
+        except Exception:
+            pass
+
     def _builder_maybe_autosync(self) -> None:
         if bool(self.builder_autosync_var.get()):
             self._builder_to_editor()
@@ -1876,6 +2173,7 @@ class AutoClickerGUI:
     # Builder Window
     # ------------------------------------------------------------------
     def _open_builder_window(self) -> None:
+        self._ensure_builder_vars()
         if self._builder_win and tk.Toplevel.winfo_exists(self._builder_win):
             try:
                 self._builder_win.deiconify()
@@ -2109,6 +2407,7 @@ class AutoClickerGUI:
         self._builder_capture_in_progress = False
 
     def _builder_to_editor(self) -> None:
+        self._ensure_builder_vars()
         try:
             data = {"name": "Script", "actions": self.script_actions or []}
             # Loop settings
@@ -2125,6 +2424,7 @@ class AutoClickerGUI:
             self._log_message(f"Builder→Editor Fehler: {exc}", level="ERROR")
 
     def _editor_to_builder(self) -> None:
+        self._ensure_builder_vars()
         try:
             raw = self.script_text.get("1.0", tk.END).strip()
             data = json.loads(raw)
@@ -2138,9 +2438,16 @@ class AutoClickerGUI:
                     continue
                 t = a.get("type")
                 if t == "type_text":
-                    sanitized.append({"type": t, "text": a.get("text", "")})
+                    out = {"type": t, "text": a.get("text", "")}
+                    for key in ("pause", "post_delay"):
+                        if a.get(key) is not None:
+                            out[key] = float(a[key])
+                    sanitized.append(out)
                 elif t == "send_keys":
-                    sanitized.append({"type": t, "sequence": a.get("sequence", "")})
+                    out = {"type": t, "sequence": a.get("sequence", "")}
+                    if a.get("post_delay") is not None:
+                        out["post_delay"] = float(a["post_delay"])
+                    sanitized.append(out)
                 elif t == "wait":
                     ms = int(a.get("milliseconds", 0) or 0)
                     sanitized.append({"type": t, "milliseconds": max(0, ms)})
@@ -2382,9 +2689,8 @@ class AutoClickerGUI:
 
     def _open_script_file(self) -> None:
         try:
-            from tkinter import filedialog
             path = filedialog.askopenfilename(
-                filetypes=[("JSON", "*.json"), ("Alle Dateien", "*.*")]
+                filetypes=self._SCRIPT_OPEN_FILETYPES
             )
             if not path:
                 return
@@ -2399,8 +2705,7 @@ class AutoClickerGUI:
 
     def _save_script_as(self) -> None:
         try:
-            from tkinter import filedialog
-            path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+            path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=self._SCRIPT_SAVE_FILETYPES)
             if not path:
                 return
             content = self.script_text.get("1.0", tk.END).strip()
@@ -2420,14 +2725,16 @@ class AutoClickerGUI:
             return
         raw = self.script_text.get("1.0", tk.END).strip()
         try:
-            data = json.loads(raw)
-            script = AutomationScript.from_dict(data)
-            engine = AutomationEngine(script)
-            engine.on_log(lambda m: self._log_message(f"[Script] {m}"))
-            engine.on_done(lambda ok, msg: self._on_script_done(ok, msg))
-            self.script_engine = engine
+            script = AutomationScript.from_json(raw)
+            engine = self.script_engine
+            if engine is None:
+                # One engine (and worker thread) is reused for every script run
+                engine = AutomationEngine()
+                engine.on_log(lambda m: self._engine_queue.put((self._log_message, (f"[Script] {m}",))))
+                engine.on_done(lambda ok, msg: self._engine_queue.put((self._on_script_done, (ok, msg))))
+                self.script_engine = engine
             self.script_status_var.set("Script: Läuft")
-            engine.start()
+            engine.start(script)
         except Exception as exc:
             messagebox.showerror("Script", f"Ungültiges Script: {exc}")
             self.script_status_var.set("Script: Fehler")
@@ -2447,19 +2754,28 @@ class AutoClickerGUI:
     # Misc helpers
     # ------------------------------------------------------------------
     def _on_click_mode_changed(self) -> None:
-        static_mode = ClickMode(self.click_mode_var.get()) == ClickMode.STATIC_SEQUENCE
+        static_mode = self._cached_click_mode == ClickMode.STATIC_SEQUENCE
         state = tk.NORMAL if static_mode else tk.DISABLED
-        for widget in (
-            self.position_listbox,
-            self.add_current_button,
-            self.add_custom_button,
-            self.capture_button,
-            self.capture_cancel_button,
-            self.remove_selected_button,
-            self.clear_all_button,
-        ):
-            widget.configure(state=state)
-        if not static_mode:
+        if state == self._last_mode_state:
+            return  # Radio button re-selected; nothing changed
+        self._last_mode_state = state
+        if not self._mode_state_scripts:
+            widgets = (
+                self.position_listbox,
+                self.add_current_button,
+                self.add_custom_button,
+                self.capture_button,
+                self.capture_cancel_button,
+                self.remove_selected_button,
+                self.clear_all_button,
+            )
+            # One Tcl script per state instead of a configure call per widget
+            for value in (tk.NORMAL, tk.DISABLED):
+                self._mode_state_scripts[value] = "; ".join(
+                    f"{widget} configure -state {value}" for widget in widgets
+                )
+        self.root.tk.eval(self._mode_state_scripts[state])
+        if not static_mode and self.position_listbox.curselection():
             self.position_listbox.selection_clear(0, tk.END)
         self._persist_settings()
 
@@ -2467,10 +2783,51 @@ class AutoClickerGUI:
         self.debug_overlay.toggle(enabled)
         self._persist_settings()
 
+    def _on_root_map(self, event: tk.Event) -> None:
+        # Bindings on root also fire for its child widgets
+        if event.widget is self.root and not self._ui_visible.is_set():
+            self._ui_visible.set()
+            self._write_log_widget()
+
+    def _on_root_unmap(self, event: tk.Event) -> None:
+        if event.widget is self.root:
+            self._ui_visible.clear()
+
+    def _sample_cursor_loop(self) -> None:
+        """Sample the cursor off the Tk thread; the UI only reads _cursor_xy."""
+        read_cursor = cursor_reader()
+        while not self._cursor_stop.is_set():
+            if not self._ui_visible.is_set():
+                # Window hidden: nothing shows the cursor, sleep until mapped
+                self._ui_visible.wait()
+                continue
+            self._cursor_xy = read_cursor()
+            self._cursor_stop.wait(self.CURSOR_SAMPLE_INTERVAL)
+
     def _start_monitor_updates(self) -> None:
-        def poll() -> None:
+        self._monitor_last_cursor: Optional[Tuple[int, int]] = None
+        self._monitor_last_info = ""
+        self._monitor_interval = self.MONITOR_POLL_MS
+        # Register the poll as a Tcl command once; root.after() would wrap and
+        # register a fresh command on every tick
+        self._monitor_poll_cmd = self.root.register(self._poll_monitor)
+        self._poll_monitor()
+
+    def _poll_monitor(self) -> None:
+        if not self._ui_visible.is_set():
+            self.monitor_job = self.root.tk.call("after", self.MONITOR_POLL_MAX_MS, self._monitor_poll_cmd)
+            return
+        cursor = self._cursor_xy
+        if cursor is not None and cursor == self._monitor_last_cursor:
+            # Idle cursor: nothing to redraw, poll less often
+            self._monitor_interval = min(
+                self.MONITOR_POLL_MAX_MS, int(self._monitor_interval * self.MONITOR_POLL_BACKOFF)
+            )
+        else:
+            self._monitor_last_cursor = cursor
+            self._monitor_interval = self.MONITOR_POLL_MIN_MS
             try:
-                x, y = pyautogui.position()
+                x, y = cursor
                 # Compute monitor list (lazy)
                 mons = self._get_monitors()
                 idx = self._find_monitor_index(int(x), int(y), mons)
@@ -2481,15 +2838,22 @@ class AutoClickerGUI:
                     info = (
                         f"Cursor: ({int(x)}, {int(y)}) | Monitor {idx+1}: {m['width']}x{m['height']} @ ({m['x']},{m['y']}) | Monitore: {len(mons)}"
                     )
-                self.monitor_info_var.set(info)
             except Exception:
-                self.monitor_info_var.set("Cursorinformationen nicht verfügbar.")
-            self.monitor_job = self.root.after(self.MONITOR_POLL_MS, poll)
-
-        poll()
+                info = "Cursorinformationen nicht verfügbar."
+            if info != self._monitor_last_info:
+                self._monitor_last_info = info
+                self.monitor_info_var.set(info)
+        self.monitor_job = self.root.tk.call("after", self._monitor_interval, self._monitor_poll_cmd)
 
     def _get_monitors(self) -> List[Dict[str, int]]:
-        """List monitor rectangles as dicts with x,y,width,height."""
+        """List monitor rectangles as dicts with x,y,width,height (cached briefly)."""
+        now = time.monotonic()
+        if now - self._monitors_cached_at >= self.MONITOR_CACHE_SECONDS:
+            self._monitors_cache = self._query_monitors()
+            self._monitors_cached_at = now
+        return self._monitors_cache
+
+    def _query_monitors(self) -> List[Dict[str, int]]:
         try:
             from screeninfo import get_monitors  # type: ignore
             mons = get_monitors() or []
@@ -2500,10 +2864,9 @@ class AutoClickerGUI:
                 return out
         except Exception:
             pass
-        # Fallback: single screen via pyautogui
+        # Fallback: single screen as reported by Tk
         try:
-            s = pyautogui.size()
-            return [{"x": 0, "y": 0, "width": int(s.width), "height": int(s.height)}]
+            return [{"x": 0, "y": 0, "width": self.root.winfo_screenwidth(), "height": self.root.winfo_screenheight()}]
         except Exception:
             return [{"x": 0, "y": 0, "width": 1280, "height": 800}]
 
@@ -2548,7 +2911,7 @@ class AutoClickerGUI:
 
     def _builder_set_xy_from_cursor(self) -> None:
         try:
-            x, y = pyautogui.position()
+            x, y = self._cursor_xy or cursor_position() or self.root.winfo_pointerxy()
             # Same clamping as capture to be consistent across monitors
             mons = self._get_monitors()
             if mons:
@@ -2573,43 +2936,101 @@ class AutoClickerGUI:
         return None
 
     def _export_logs(self) -> None:
-        from tkinter import filedialog
-
         path = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Textdateien", "*.txt"), ("Alle Dateien", "*.*")],
+            filetypes=self._EXPORT_FILETYPES,
         )
         if not path:
             return
+        self._flush_log()
         if self.logger.export_logs_to_file(path):
             messagebox.showinfo("Export", "Log erfolgreich exportiert.")
         else:
             messagebox.showerror("Export", "Log konnte nicht exportiert werden.")
 
     def _persist_settings(self) -> None:
+        """Update self.settings now and schedule the disk write; bursts collapse into one."""
         if self._persist_suspended:
             return
+        self._collect_settings()
+        if self._pending_persist_job:
+            self.root.after_cancel(self._pending_persist_job)
+        self._pending_persist_job = self.root.after(self.PERSIST_DEBOUNCE_MS, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        self._pending_persist_job = None
+        self._enqueue_persist(copy.copy(self.settings))
+
+    def _enqueue_persist(self, item: Optional[ApplicationSettings]) -> None:
+        # Replace a snapshot the worker hasn't picked up yet
+        try:
+            self._persist_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._persist_queue.put(item)
+
+    def _flush_settings_now(self) -> None:
+        """Stop the persist worker and write the current settings synchronously."""
+        if self._pending_persist_job:
+            self.root.after_cancel(self._pending_persist_job)
+            self._pending_persist_job = None
+        # A snapshot still queued is older than what is written below
+        self._enqueue_persist(None)
+        self._persist_thread.join(timeout=2.0)
+        self._collect_settings()
+        try:
+            self.settings_manager.save(self.settings)
+        except OSError:
+            pass
+
+    def _persist_worker(self) -> None:
+        while True:
+            snapshot = self._persist_queue.get()
+            if snapshot is None:
+                return
+            try:
+                # save() skips the write when the serialized settings are unchanged
+                self.settings_manager.save(snapshot)
+            except OSError as exc:
+                self._engine_queue.put(
+                    (self._log_message, (f"Einstellungen konnten nicht gespeichert werden: {exc}", "ERROR"))
+                )
+
+    def _collect_settings(self) -> None:
         self.settings.click_positions = list(self.click_positions)
-        self.settings.click_rate_per_second = float(self.click_rate_var.get())
-        self.settings.total_clicks = int(self.total_clicks_var.get())
-        self.settings.click_type = ClickType(self.click_type_var.get())
-        self.settings.click_mode = ClickMode(self.click_mode_var.get())
+        if self._validated_rate is not None:
+            self.settings.click_rate_per_second = self._validated_rate
+        if self._validated_total is not None:
+            self.settings.total_clicks = self._validated_total
+        self.settings.click_type = self._cached_click_type
+        self.settings.click_mode = self._cached_click_mode
         self.settings.run_in_background = bool(self.background_var.get())
         self.settings.debug_overlay_enabled = bool(self.debug_overlay_var.get())
         self.settings.dark_mode_enabled = bool(self.dark_mode_var.get())
         self.settings.start_hotkey = self.start_hotkey_var.get().strip() or "F6"
         self.settings.stop_hotkey = self.stop_hotkey_var.get().strip() or "F7"
-        self.settings_manager.save(self.settings)
 
     def _on_closing(self) -> None:
+        # Nothing below may schedule its own write; settings are saved once at the end
+        self._persist_suspended = True
         self._cancel_capture()
+        self.capture_service.close()
         self._stop_manual_clicking()
         self._stop_automation()
+        if self.script_engine:
+            self.script_engine.close()
         self.hotkey_manager.disable_hotkeys()
         self.debug_overlay.disable()
+        self._cursor_stop.set()
+        self._ui_visible.set()  # wake the sampler so it sees the stop flag
+        if self._engine_queue_job:
+            self.root.after_cancel(self._engine_queue_job)
         if self.monitor_job:
-            self.root.after_cancel(self.monitor_job)
-        self._persist_settings()
+            self.root.tk.call("after", "cancel", self.monitor_job)
+        if self._metrics_after_id is not None:
+            self.root.after_cancel(self._metrics_after_id)
+        self._flush_log()
+        self._flush_settings_now()
         self.root.destroy()
 
     # ------------------------------------------------------------------
@@ -5,7 +5,7 @@ Each class follows the Single Responsibility Principle (SRP).
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Sequence
 
 
 class ClickType(Enum):
@@ -63,7 +63,7 @@ class ClickConfiguration:
     and validation. Clean Code principle: descriptive name that
     clearly indicates what this class represents.
     """
-    click_positions: List[ClickPosition]
+    click_positions: Sequence[ClickPosition]
     click_rate_per_second: float
     total_clicks: int
     click_type: ClickType
@@ -0,0 +1,248 @@
+"""Direct OS mouse clicks for the clicker engine.
+
+pyautogui.click does a position query, tweening, pause handling and several
+foreign calls per click. The clicker only needs "press and release here", so
+this module talks to the platform API directly:
+
+- Windows: one SendInput call with a cached INPUT array (2 events, 4 for a
+  double click), after SetCursorPos when a target position is given.
+- Linux/X11: XTest fake button events over one persistent display connection.
+- Anything else: pyautogui.
+
+ctypes releases the GIL for the duration of each foreign call, so the Tk
+thread keeps running while the click is injected. A click the OS refuses
+(e.g. SendInput blocked by UIPI) or a lost X connection raises OSError.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from typing import Any, Callable, Optional, Tuple
+
+from automation import win32
+
+try:
+    from Xlib import X, display as xdisplay  # type: ignore
+    from Xlib.ext import xtest  # type: ignore
+    from Xlib import error as xerror  # type: ignore
+    # Raised by python-xlib instead of OSError; clicks re-raise them as OSError
+    _X_ERRORS: Tuple[type, ...] = (xerror.XError, xerror.ConnectionClosedError, xerror.DisplayError)
+except Exception:  # pragma: no cover - environment dependent
+    X = None  # type: ignore
+    xdisplay = None  # type: ignore
+    xtest = None  # type: ignore
+    _X_ERRORS = ()
+
+_X_BUTTONS = {"left": 1, "middle": 2, "right": 3}
+
+
+def cursor_position() -> Optional[Tuple[int, int]]:
+    """Current cursor position, or None on failure.
+
+    Off Windows this goes through pyautogui, whose X11 backend shares one
+    module-global display that is not thread-safe; threads polling the cursor
+    should use their own ``cursor_reader()`` instead.
+    """
+    if win32.IS_WINDOWS:
+        return win32.cursor_position()
+    try:
+        import pyautogui  # type: ignore
+        x, y = pyautogui.position()
+        return int(x), int(y)
+    except Exception:
+        return None
+
+
+def cursor_reader() -> Callable[[], Optional[Tuple[int, int]]]:
+    """Cheapest cursor query for repeated use from the calling thread.
+
+    Windows: GetCursorPos. X11: query_pointer on a display connection owned by
+    the returned function (so it must stay on one thread). Otherwise the
+    module-level cursor_position.
+    """
+    if win32.IS_WINDOWS:
+        return win32.cursor_position
+    if xdisplay is not None:
+        try:
+            root = xdisplay.Display().screen().root
+        except Exception:
+            root = None
+        if root is not None:
+            def read() -> Optional[Tuple[int, int]]:
+                try:
+                    pointer = root.query_pointer()
+                    return int(pointer.root_x), int(pointer.root_y)
+                except Exception:
+                    return None
+            return read
+    return cursor_position
+
+
+class NativeClicker:
+    """Clicks through the cheapest backend available on this platform."""
+
+    def __init__(self) -> None:
+        self._display: Optional[Any] = None
+        self._pyautogui: Optional[Any] = None
+        if win32.IS_WINDOWS:
+            self.backend = "win32"
+            # Resolve the prototyped foreign functions once; a click is then a
+            # single ctypes call (GIL released) on a cached INPUT array.
+            user32 = win32.get_user32()
+            self._send_input = user32.SendInput
+            self._set_cursor_pos = user32.SetCursorPos
+            self._input_size = ctypes.sizeof(win32.INPUT)
+        elif self._open_display():
+            self.backend = "xtest"
+        else:
+            self.backend = "pyautogui"
+            import pyautogui  # type: ignore
+            self._pyautogui = pyautogui
+
+    def _open_display(self) -> bool:
+        if xdisplay is None or xtest is None:
+            return False
+        try:
+            self._display = xdisplay.Display()
+            return bool(self._display.has_extension("XTEST"))
+        except Exception:
+            self._display = None
+            return False
+
+    def click_at(self, x: int, y: int, button: str = "left", double: bool = False) -> None:
+        """Move to (x, y) and click there."""
+        if self.backend == "win32":
+            self._set_cursor_pos(x, y)
+            self._win_click(button, double)
+        elif self.backend == "xtest":
+            xtest.fake_input(self._display, X.MotionNotify, x=x, y=y)
+            self._x_click(button, double)
+        elif double:
+            self._pyautogui.doubleClick(x=x, y=y, button=button)
+        else:
+            self._pyautogui.click(x, y, button=button)
+
+    def click_current(self, button: str = "left", double: bool = False) -> None:
+        """Click wherever the cursor currently is (no position query needed)."""
+        if self.backend == "win32":
+            self._win_click(button, double)
+        elif self.backend == "xtest":
+            self._x_click(button, double)
+        elif double:
+            self._pyautogui.doubleClick(button=button)
+        else:
+            self._pyautogui.click(button=button)
+
+    def bind_click_at(self, button: str, double: bool, repeat: int = 1) -> Callable[[int, int], None]:
+        """
+        Return a branch-free ``click(x, y)`` for a fixed button/click count.
+
+        Backend, button and single/double never change during a run, so the
+        choice is made once here rather than on every click. ``repeat`` > 1
+        performs that many clicks per call (one SendInput batch on Windows).
+        """
+        if self.backend == "win32":
+            set_cursor_pos = self._set_cursor_pos
+            send_input = self._send_input
+            size = self._input_size
+            buffer = win32.mouse_click_buffer(button, (2 if double else 1) * repeat)
+            count = len(buffer)
+
+            def click_win32(x: int, y: int) -> None:
+                set_cursor_pos(x, y)
+                if send_input(count, buffer, size) != count:
+                    raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+            return click_win32
+        if self.backend == "xtest":
+            fake_input, display = xtest.fake_input, self._display
+            x_click = self._bind_x_click(button, double, repeat)
+
+            def click_xtest(x: int, y: int) -> None:
+                try:
+                    fake_input(display, X.MotionNotify, x=x, y=y)
+                except _X_ERRORS as e:
+                    raise OSError(f"XTest motion failed: {e}") from e
+                x_click()
+            return click_xtest
+        pyautogui = self._pyautogui
+        if double:
+            return lambda x, y: pyautogui.click(x, y, clicks=2 * repeat, button=button)
+        return lambda x, y: pyautogui.click(x, y, clicks=repeat, button=button)
+
+    def bind_click_current(self, button: str, double: bool, repeat: int = 1) -> Callable[[], None]:
+        """Return a branch-free ``click()`` at the current cursor position."""
+        if self.backend == "win32":
+            send_input = self._send_input
+            size = self._input_size
+            buffer = win32.mouse_click_buffer(button, (2 if double else 1) * repeat)
+            count = len(buffer)
+
+            def click_win32() -> None:
+                if send_input(count, buffer, size) != count:
+                    raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+            return click_win32
+        if self.backend == "xtest":
+            return self._bind_x_click(button, double, repeat)
+        pyautogui = self._pyautogui
+        if double:
+            return lambda: pyautogui.click(clicks=2 * repeat, button=button)
+        return lambda: pyautogui.click(clicks=repeat, button=button)
+
+    def _bind_x_click(self, button: str, double: bool, repeat: int = 1) -> Callable[[], None]:
+        detail = _X_BUTTONS.get(button, 1)
+        display = self._display
+        fake_input = xtest.fake_input
+        press, release = X.ButtonPress, X.ButtonRelease
+        repeats = range((2 if double else 1) * repeat)
+
+        def x_click() -> None:
+            try:
+                for _ in repeats:
+                    fake_input(display, press, detail)
+                    fake_input(display, release, detail)
+                display.sync()
+            except _X_ERRORS as e:
+                raise OSError(f"XTest click failed: {e}") from e
+        return x_click
+
+    def _win_click(self, button: str, double: bool) -> None:
+        # Both press/release pairs of a double click go out in the same call
+        buffer = win32.mouse_click_buffer(button, 2 if double else 1)
+        if self._send_input(len(buffer), buffer, self._input_size) != len(buffer):
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+
+    def _x_click(self, button: str, double: bool) -> None:
+        detail = _X_BUTTONS.get(button, 1)
+        display = self._display
+        try:
+            for _ in range(2 if double else 1):
+                xtest.fake_input(display, X.ButtonPress, detail)
+                xtest.fake_input(display, X.ButtonRelease, detail)
+            display.sync()
+        except _X_ERRORS as e:
+            raise OSError(f"XTest click failed: {e}") from e
+
+    def cursor_position(self) -> Optional[Tuple[int, int]]:
+        """Current cursor position, queried from the same backend."""
+        if self.backend == "win32":
+            return win32.cursor_position()
+        if self.backend == "xtest":
+            try:
+                pointer = self._display.screen().root.query_pointer()
+                return int(pointer.root_x), int(pointer.root_y)
+            except Exception:
+                return None
+        try:
+            x, y = self._pyautogui.position()
+            return int(x), int(y)
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        """Release the X display connection, if any."""
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception:
+                pass
+            self._display = None
@@ -0,0 +1,149 @@
+"""High-resolution periodic tick sources for the click loop.
+
+time.sleep()/Event.wait() wake up on the scheduler tick (up to ~15 ms on a
+default Windows system), which caps the achievable click rate. A kernel timer
+armed for the exact period wakes the thread much closer to the deadline:
+
+- Linux (Python 3.13+): timerfd with CLOCK_MONOTONIC, read once per tick.
+- Windows 10 1803+: a high-resolution waitable timer re-armed for each
+  absolute deadline (SetWaitableTimer only supports millisecond periods).
+
+``make_ticker`` returns None where neither is available; callers then keep
+their sleep-based pacing.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import sys
+import time
+from typing import Optional, Union
+
+THREAD_PRIORITY_TIME_CRITICAL = 15
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
+
+# Shortest click period the pacing on this platform keeps reliably, in seconds:
+# the high-resolution waitable timer ticks in ~0.5 ms steps, a timerfd wakes up
+# within ~0.1 ms, and plain sleeps are good for about 1 ms.
+if sys.platform.startswith("win"):
+    TIMER_RESOLUTION = 0.0005
+elif hasattr(os, "timerfd_create"):
+    TIMER_RESOLUTION = 0.0001
+else:
+    TIMER_RESOLUTION = 0.001
+
+
+class TimerFdTicker:
+    """Periodic ticks from a Linux timerfd."""
+
+    def __init__(self, period: float) -> None:
+        self._fd = os.timerfd_create(time.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC)  # type: ignore[attr-defined]
+        os.timerfd_settime(self._fd, initial=period, interval=period)  # type: ignore[attr-defined]
+
+    def wait(self) -> None:
+        """Block until the next tick (returns at once if ticks were missed)."""
+        os.read(self._fd, 8)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class WaitableTimerTicker:
+    """Periodic ticks from a high-resolution Windows waitable timer."""
+
+    def __init__(self, period: float) -> None:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        kernel32.CreateWaitableTimerExW.argtypes = (ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32)
+        kernel32.CreateWaitableTimerExW.restype = ctypes.c_void_p
+        kernel32.SetWaitableTimer.argtypes = (
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_longlong),
+            ctypes.c_long,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_int,
+        )
+        kernel32.SetWaitableTimer.restype = ctypes.c_int
+        kernel32.WaitForSingleObject.argtypes = (ctypes.c_void_p, ctypes.c_uint32)
+        kernel32.WaitForSingleObject.restype = ctypes.c_uint32
+        kernel32.CloseHandle.argtypes = (ctypes.c_void_p,)
+        kernel32.CloseHandle.restype = ctypes.c_int
+
+        handle = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+        if not handle:
+            raise OSError(ctypes.get_last_error(), "CreateWaitableTimerExW failed")
+        self._kernel32 = kernel32
+        self._handle = handle
+        self._period = period
+        self._due = ctypes.c_longlong()
+        self._deadline = time.perf_counter() + period
+
+    def wait(self) -> None:
+        """Block until the next tick (returns at once if ticks were missed).
+
+        Deadlines advance by exactly one period; after falling more than a
+        period behind (a stall), missed ticks are dropped and the schedule
+        restarts from now, like a timerfd coalescing its expirations.
+        """
+        period = self._period
+        remaining = self._deadline - time.perf_counter()
+        if remaining > 0:
+            # Negative due time = relative, in 100 ns units
+            self._due.value = -max(1, int(remaining * 10_000_000))
+            self._kernel32.SetWaitableTimer(self._handle, ctypes.byref(self._due), 0, None, None, 0)
+            self._kernel32.WaitForSingleObject(self._handle, INFINITE)
+            self._deadline += period
+        elif remaining < -period:
+            self._deadline = time.perf_counter() + period
+        else:
+            self._deadline += period
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
+Ticker = Union[TimerFdTicker, WaitableTimerTicker]
+
+
+def make_ticker(period: float) -> Optional[Ticker]:
+    """Return a started ticker for ``period`` seconds, or None if unsupported here."""
+    if period <= 0:
+        return None
+    try:
+        if sys.platform.startswith("win"):
+            return WaitableTimerTicker(period)
+        if hasattr(os, "timerfd_create"):
+            return TimerFdTicker(period)
+    except Exception:
+        return None
+    return None
+
+
+def raise_thread_priority() -> bool:
+    """Best-effort: run the calling thread at real-time/time-critical priority.
+
+    Windows uses THREAD_PRIORITY_TIME_CRITICAL; Linux tries SCHED_FIFO, which
+    usually needs CAP_SYS_NICE. Returns False when the OS refuses. The change
+    ends with the thread, so there is nothing to restore.
+    """
+    try:
+        if sys.platform.startswith("win"):
+            kernel32 = ctypes.WinDLL("kernel32")  # type: ignore[attr-defined]
+            kernel32.GetCurrentThread.restype = ctypes.c_void_p
+            kernel32.SetThreadPriority.argtypes = (ctypes.c_void_p, ctypes.c_int)
+            kernel32.SetThreadPriority.restype = ctypes.c_int
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL))
+        if hasattr(os, "sched_setscheduler"):
+            # On Linux pid 0 targets the calling thread only
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+            return True
+    except Exception:
+        return False
+    return False
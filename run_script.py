@@ -7,7 +7,6 @@ Usage (PowerShell):
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
@@ -23,15 +22,14 @@ def main() -> int:
     if not path.exists():
         print(f"File not found: {path}")
         return 2
-    data = json.loads(path.read_text(encoding="utf-8"))
-    script = AutomationScript.from_dict(data)
+    script = AutomationScript.from_json(path.read_bytes())
     engine = AutomationEngine(script)
     engine.on_log(lambda m: print(m))
     engine.on_done(lambda ok, msg: print(f"DONE: {ok} - {msg}"))
     engine.start()
-    # Wait until thread finishes
-    if engine._thread:  # type: ignore[attr-defined]
-        engine._thread.join()
+    # Wait until the run finishes, then stop the worker
+    engine.wait()
+    engine.close()
     return 0
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from hashlib import blake2b
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,8 @@ class SettingsManager:
     def __init__(self, storage_path: Optional[Path] = None) -> None:
         package_root = Path(__file__).resolve().parent
         self._storage_path = storage_path or package_root / "settings.json"
+        # Digest of the payload last read or written; unchanged saves are skipped
+        self._last_digest: Optional[bytes] = None
 
     @property
     def storage_path(self) -> Path:
@@ -32,7 +35,9 @@ class SettingsManager:
             raw_data = json.loads(content)
             if not isinstance(raw_data, dict):
                 raise ValueError("Settings file has invalid structure")
-            return ApplicationSettings.from_dict(raw_data)
+            settings = ApplicationSettings.from_dict(raw_data)
+            self._last_digest = blake2b(content.encode("utf-8")).digest()
+            return settings
         except Exception:
             # Corrupt or unreadable file; fall back to defaults but keep backup for inspection.
             backup_path = path.with_suffix(".bak")
@@ -43,12 +48,22 @@ class SettingsManager:
                 pass
             return ApplicationSettings()
 
-    def save(self, settings: ApplicationSettings) -> None:
-        """Persist settings atomically to disk."""
+    def save(self, settings: ApplicationSettings) -> bool:
+        """Persist settings atomically to disk.
+
+        Returns False without touching the disk when the serialized settings
+        are identical to what was last loaded or saved.
+        """
+        payload = json.dumps(settings.to_dict(), indent=2, ensure_ascii=False)
+        digest = blake2b(payload.encode("utf-8")).digest()
+        if digest == self._last_digest:
+            return False
+
         path = self.storage_path
         path.parent.mkdir(parents=True, exist_ok=True)
 
         tmp_path = path.with_suffix(".tmp")
-        payload = json.dumps(settings.to_dict(), indent=2, ensure_ascii=False)
         tmp_path.write_text(payload, encoding="utf-8")
         tmp_path.replace(path)
+        self._last_digest = digest
+        return True